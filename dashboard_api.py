@@ -1,8 +1,16 @@
 import os
 import csv
+import gc
 import json
-from typing import List, Dict, Any, Optional
-from fastapi import FastAPI, HTTPException, Query
+from array import array
+from bisect import bisect_right
+from collections import Counter, OrderedDict, defaultdict
+from functools import lru_cache
+from heapq import nlargest, nsmallest
+from itertools import chain, islice, takewhile
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, Tuple, Callable, Sequence, Set
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
@@ -10,6 +18,8 @@ from pathlib import Path
 from datetime import datetime
 import logging
 import sys
+import threading
+import time
 import requests
 
 app = FastAPI(title="GitHub Data Dashboard API")
@@ -44,6 +54,23 @@ class Repository(BaseModel):
     class Config:
         arbitrary_types_allowed = True
 
+# Fields returned by /api/repositories
+REPOSITORY_FIELDS = tuple(Repository.model_fields)
+
+# Sort keys supported by /api/repositories, applied to rows projected onto REPOSITORY_FIELDS
+# (so every field is present and the counts are already ints)
+REPOSITORY_SORT_KEYS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "stargazers_count": itemgetter("stargazers_count"),
+    "forks_count": itemgetter("forks_count"),
+    "updated_at": lambda x: x["updated_at"] or ""
+}
+
+# Sort keys of /api/candidates that are served from precomputed orders
+CANDIDATE_SORT_KEYS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "total_contributions": lambda x: x.get("total_contributions", 0),
+    "followers": lambda x: x.get("followers", 0)
+}
+
 class Contributor(BaseModel):
     username: str
     name: Optional[str] = None
@@ -69,6 +96,13 @@ class Contributor(BaseModel):
         allow_population_by_field_name = True
         arbitrary_types_allowed = True
 
+# Fields returned by /api/contributors (by their serialized names, e.g. "type")
+CONTRIBUTOR_FIELDS = tuple(field.alias or name for name, field in Contributor.model_fields.items())
+
+# Contributor fields the CSV stores as text but the Contributor model types more strictly
+CONTRIBUTOR_OPTIONAL_INT_FIELDS = ("public_repos", "public_gists", "followers", "following")
+CONTRIBUTOR_DATETIME_FIELDS = ("created_at", "updated_at")
+
 class DashboardStats(BaseModel):
     total_repositories: int
     total_contributors: int
@@ -77,34 +111,119 @@ class DashboardStats(BaseModel):
     repositories_by_stars: List[Dict[str, Any]]
     contributors_by_followers: List[Dict[str, Any]]
 
+# Directory the scraper writes its CSV files to
+DATA_DIR = Path("github_data_2")
+
+# CSV columns converted to integers at load time
+INT_COLUMNS = frozenset({
+    "id", "total_contributions", "contributions", "followers", "public_repos", "stargazers_count",
+    "forks_count", "size"
+})
+
+# Lowercased placeholder values treated as missing in text columns
+NULL_STRINGS = frozenset({"null", "none", ""})
+
+# Repository size buckets for /api/stats/extended: upper bounds in KB (the unit of the
+# size column) and the label of each bucket, including the open-ended last one
+SIZE_BUCKET_BOUNDS_KB = (1024, 10 * 1024, 100 * 1024)
+SIZE_BUCKET_LABELS = ("Small (<1MB)", "Medium (1-10MB)", "Large (10-100MB)", "Very Large (>100MB)")
+
+# Cache-Control header for the stats endpoints, which clients revalidate with their ETag
+STATS_CACHE_CONTROL = "public, max-age=30"
+
+# Parsed rows are also saved as JSON in the API's own cache directory next to this module
+# (e.g. .dashboard_cache/contributors_<timestamp>.csv.parsed.json) so a restarted API doesn't
+# have to re-parse the CSVs. JSON rather than pickle, since loading it can't run code, and
+# outside the scraper's data directory. Bump the version whenever parsing changes.
+PARSED_CACHE_DIR = Path(__file__).resolve().parent / ".dashboard_cache"
+PARSED_SIDECAR_SUFFIX = ".parsed.json"
+PARSED_SIDECAR_VERSION = 4
+
+# How many /api/candidates pages are memoized, and the largest page size that is memoized
+# (bigger pages would pin large copies of the contributors table)
+CANDIDATES_PAGE_CACHE_SIZE = 256
+CANDIDATES_PAGE_CACHE_MAX_PAGE_SIZE = 100
+
+# Timeout (seconds) for the GitHub API fallback in the contributor details endpoint, and how
+# long (seconds) its responses are reused before being revalidated with their ETag
+GITHUB_API_TIMEOUT = 10
+GITHUB_REPOS_CACHE_TTL = 300
+
+# How many users' repository lists are kept, and how many locks serialize fetches per user
+GITHUB_REPOS_CACHE_SIZE = 1024
+GITHUB_FETCH_LOCK_STRIPES = 64
+
+# Increase the CSV field size limit once at import to handle very large fields
+# (sys.maxsize overflows the C long on some platforms, so back off until it fits)
+_max_field_limit = sys.maxsize
+while True:
+    try:
+        csv.field_size_limit(_max_field_limit)
+        break
+    except OverflowError:
+        _max_field_limit = int(_max_field_limit / 10)
+
+# Health check payload, built once at startup since probes hit it constantly
+STARTED_AT = datetime.now().isoformat()
+HEALTH_RESPONSE_BODY = json.dumps({"status": "ok", "started_at": STARTED_AT}).encode()
+
+# In-process caches
+# Parsed CSV rows keyed by path, stored with the (mtime_ns, size) they were parsed from
+_CSV_CACHE: Dict[str, Tuple[int, int, Tuple[Dict[str, Any], ...]]] = {}
+
+# Derived results (e.g. aggregated stats) keyed by name, stored with the signature of their source files
+_RESULT_CACHE: Dict[str, Tuple[Tuple[Tuple[int, int], ...], Any]] = {}
+
+# Pages of /api/candidates keyed by query, all computed from the data files identified by
+# _CANDIDATES_PAGE_SOURCE (the cache is emptied when those change); least recently used first
+_CANDIDATES_PAGE_CACHE: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+_CANDIDATES_PAGE_SOURCE: Optional[Tuple[Any, ...]] = None
+_CANDIDATES_PAGE_LOCK = threading.Lock()
+
+# Pooled HTTP session for GitHub API calls, so repeat calls reuse the TLS connection
+_GITHUB_SESSION = requests.Session()
+
+# GitHub API repository lists keyed by username, stored with their fetch time and ETag and
+# bounded to the GITHUB_REPOS_CACHE_SIZE most recently used users. A fixed set of striped
+# locks (picked by username) makes concurrent requests for the same user fetch it once
+# without keeping a lock per username ever requested.
+_GITHUB_REPOS_CACHE: "OrderedDict[str, Tuple[float, str, List[Dict[str, Any]]]]" = OrderedDict()
+_GITHUB_REPOS_CACHE_LOCK = threading.Lock()
+_GITHUB_FETCH_LOCKS = tuple(threading.Lock() for _ in range(GITHUB_FETCH_LOCK_STRIPES))
+
 # Helper functions
 def get_latest_data_files() -> Dict[str, Path]:
-    """Get the latest data files from the github_data directory."""
-    data_dir = Path("github_data_2")
-    if not data_dir.exists():
+    """Get the latest data files, rescanning the data directory only when its contents change."""
+    try:
+        dir_mtime_ns = os.stat(DATA_DIR).st_mtime_ns
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="No data directory found")
     
-    # Find the latest timestamp
-    timestamps = set()
-    for file in data_dir.glob("*_*.csv"):
-        parts = file.stem.split("_")
-        if len(parts) >= 2:
-            try:
-                timestamp = "_".join(parts[-2:])
-                timestamps.add(timestamp)
-            except (ValueError, IndexError):
-                continue
+    return _scan_latest_data_files(dir_mtime_ns)
+
+@lru_cache(maxsize=1)
+def _scan_latest_data_files(dir_mtime_ns: int) -> Dict[str, Path]:
+    """
+    Get the latest data files from the github_data directory.
     
-    if not timestamps:
-        raise HTTPException(status_code=404, detail="No data files found")
+    The result is cached per directory mtime, which changes whenever a data
+    file is added to or removed from the directory.
+    """
+    # Find the latest timestamp (the last two "_"-separated parts of each file name)
+    latest_timestamp = max(
+        ("_".join(parts[-2:]) for parts in (file.stem.split("_") for file in DATA_DIR.glob("*_*.csv"))
+         if len(parts) >= 2),
+        default=None
+    )
     
-    latest_timestamp = sorted(timestamps)[-1]
+    if latest_timestamp is None:
+        raise HTTPException(status_code=404, detail="No data files found")
     
     # Get the files with the latest timestamp
     files = {
-        "repositories": data_dir / f"repositories_{latest_timestamp}.csv",
-        "repositories_detailed": data_dir / f"repositories_detailed_{latest_timestamp}.csv",
-        "contributors": data_dir / f"contributors_{latest_timestamp}.csv"
+        "repositories": DATA_DIR / f"repositories_{latest_timestamp}.csv",
+        "repositories_detailed": DATA_DIR / f"repositories_detailed_{latest_timestamp}.csv",
+        "contributors": DATA_DIR / f"contributors_{latest_timestamp}.csv"
     }
     
     # Verify files exist
@@ -114,25 +233,184 @@ def get_latest_data_files() -> Dict[str, Path]:
     
     return files
 
-def read_csv_file(file_path: str) -> List[Dict[str, Any]]:
-    """Read a CSV file and return a list of dictionaries."""
+def get_files_signature(*file_paths: Path) -> Tuple[Tuple[int, int], ...]:
+    """Get the (mtime_ns, size) of each file, used to key results derived from them."""
+    signature = []
+    for file_path in file_paths:
+        stat = os.stat(file_path)
+        signature.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+def get_files_etag(*file_paths: Path) -> str:
+    """Build an ETag for a response that only depends on the given data files."""
+    return '"' + "-".join(f"{mtime_ns}-{size}" for mtime_ns, size in get_files_signature(*file_paths)) + '"'
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's If-None-Match header matches the given ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return if_none_match.strip() == "*" or etag in [tag.strip() for tag in if_none_match.split(",")]
+
+def _parse_int(value: Any) -> int:
+    """Convert a CSV cell (or decoded JSON value) to an int, treating empty or invalid values as 0."""
+    try:
+        return int(value) if value else 0
+    except (ValueError, TypeError):
+        return 0
+
+def _repository_topics(value: Any) -> List[str]:
+    """Convert a CSV topics cell to the list returned by /api/repositories."""
+    if not value:
+        return []
+    if not isinstance(value, str):
+        return value
+    if value.startswith("[") and value.endswith("]"):
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            # If JSON parsing fails, split by commas and strip quotes
+            topics_str = value.strip("[]")
+            return [t.strip(' "\'') for t in topics_str.split(",") if t.strip()]
+    # Otherwise, just use it as a single-item list
+    return [value]
+
+def _stats_topics(value: Any) -> List[str]:
+    """Get the topics counted by /api/stats from a CSV topics cell: only JSON arrays count."""
+    if not value or not isinstance(value, str):
+        return []
+    try:
+        topics = json.loads(value)
+    except json.JSONDecodeError:
+        logging.debug("Failed to decode topics JSON from: %s", value)
+        return []
+    return topics if isinstance(topics, list) else []
+
+@lru_cache(maxsize=65536)
+def _parse_repository_contributions(value: Optional[str]) -> Tuple[Any, ...]:
+    """
+    Decode a contributors repository_contributions cell (a JSON array) into a tuple.
+    
+    Results are memoized per cell value, so each contributor's JSON is decoded
+    once rather than on every request. Empty or invalid values decode to ().
+    The decoded entries are shared, so callers must not modify them.
+    """
+    if not value or not isinstance(value, str):
+        return ()
+    try:
+        repo_contribs = json.loads(value)
+    except json.JSONDecodeError as e:
+        logging.warning(f"Invalid repository_contributions JSON: {e}")
+        return ()
+    return tuple(repo_contribs) if isinstance(repo_contribs, list) else ()
+
+def read_csv_file(file_path: str, max_rows: Optional[int] = None) -> Tuple[Dict[str, Any], ...]:
+    """
+    Read a CSV file, reusing the parsed rows while the file is unchanged.
+    
+    The returned rows are shared between requests, so callers must copy a
+    row before modifying it.
+    
+    Args:
+        file_path: Path of the CSV file
+        max_rows: Only the first max_rows rows are needed. If the file isn't
+            cached yet, just those rows are streamed from it (and not cached)
+            instead of loading the whole file.
+    """
+    path = str(file_path)
+    stat = os.stat(path)
+    cached = _CSV_CACHE.get(path)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2] if max_rows is None else cached[2][:max_rows]
+    
+    if max_rows is not None:
+        return tuple(_parse_csv_file(path, max_rows))
+    
+    # Prefer the parsed-rows sidecar from a previous run over re-parsing the CSV
+    data = _load_parsed_sidecar(path, stat)
+    if data is None:
+        data = tuple(_parse_csv_file(path))
+        _write_parsed_sidecar(path, stat, data)
+    
+    _CSV_CACHE[path] = (stat.st_mtime_ns, stat.st_size, data)
+    _evict_stale_csv_entries(path)
+    return data
+
+def _evict_stale_csv_entries(keep_path: str) -> None:
+    """Drop cached rows of CSV files that are no longer the latest data files (e.g. earlier scraper runs)."""
+    try:
+        current_paths = {str(file_path) for file_path in get_latest_data_files().values()}
+    except HTTPException:
+        return
+    current_paths.add(keep_path)
+    for path in list(_CSV_CACHE):
+        if path not in current_paths:
+            _CSV_CACHE.pop(path, None)
+
+def _parsed_sidecar_path(path: str) -> Path:
+    """Get the path of the parsed-rows cache file for a CSV file."""
+    return PARSED_CACHE_DIR / (Path(path).name + PARSED_SIDECAR_SUFFIX)
+
+def _load_parsed_sidecar(path: str, stat: os.stat_result) -> Optional[Tuple[Dict[str, Any], ...]]:
+    """Load the parsed rows cached for a CSV file, if they match its current version."""
+    sidecar_path = _parsed_sidecar_path(path)
+    try:
+        with open(sidecar_path, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logging.warning(f"Ignoring unreadable parsed cache {sidecar_path}: {e}")
+        return None
+    
+    if (not isinstance(saved, dict) or saved.get("format_version") != PARSED_SIDECAR_VERSION or
+            saved.get("mtime_ns") != stat.st_mtime_ns or saved.get("size") != stat.st_size):
+        return None
+    return tuple(saved["rows"])
+
+def _write_parsed_sidecar(path: str, stat: os.stat_result, data: Tuple[Dict[str, Any], ...]) -> None:
+    """Cache parsed rows for a CSV file so later runs can skip parsing it."""
+    sidecar_path = _parsed_sidecar_path(path)
+    tmp_path = sidecar_path.with_name(sidecar_path.name + ".tmp")
     try:
-        # Increase CSV field size limit to handle very large fields
-        max_field_limit = sys.maxsize
-        while True:
+        PARSED_CACHE_DIR.mkdir(exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "format_version": PARSED_SIDECAR_VERSION,
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "rows": data
+            }, f, separators=(",", ":"))
+        os.replace(tmp_path, sidecar_path)
+    except OSError as e:
+        logging.warning(f"Could not write parsed cache {sidecar_path}: {e}")
+        return
+    
+    # Remove cache files of CSVs that are no longer the latest data files
+    try:
+        current_names = {
+            file_path.name + PARSED_SIDECAR_SUFFIX for file_path in get_latest_data_files().values()
+        }
+    except HTTPException:
+        return
+    current_names.add(sidecar_path.name)
+    for cached_file in PARSED_CACHE_DIR.glob("*" + PARSED_SIDECAR_SUFFIX):
+        if cached_file.name not in current_names:
             try:
-                csv.field_size_limit(max_field_limit)
-                break
-            except OverflowError:
-                max_field_limit = int(max_field_limit / 10)
-        
+                cached_file.unlink()
+            except OSError:
+                pass
+
+def _parse_csv_file(file_path: str, max_rows: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Read a CSV file (or just its first max_rows rows) and return a list of dictionaries."""
+    try:
         with open(file_path, 'r', encoding='utf-8') as f:
             # Get the header row
             reader = csv.reader(f)
             header = next(reader)
             
             # Log the headers for debugging
-            logging.info(f"CSV headers for {file_path}: {header}")
+            logging.debug("CSV headers for %s: %s", file_path, header)
             
             # Normalize header names
             normalized_header = []
@@ -141,52 +419,483 @@ def read_csv_file(file_path: str) -> List[Dict[str, Any]]:
                 
                 normalized_header.append(field_name)
             
-            # Read the data
+            # Resolve which columns need type conversion once per file
+            width = len(normalized_header)
+            int_columns = [i for i, field in enumerate(normalized_header) if field in INT_COLUMNS]
+            
+            # Read the data. The rows hold no reference cycles, so pause the
+            # cyclic garbage collector instead of letting it rescan every
+            # freshly built dict during the bulk load.
             data = []
-            for row in reader:
-                if len(row) != len(normalized_header):
-                    # Skip malformed rows
-                    logging.warning(f"Skipping malformed row: {row}")
-                    continue
-                    
-                item = {}
-                for i, field in enumerate(normalized_header):
-                    # Handle empty values
-                    value = row[i].strip() if i < len(row) else ""
+            skipped_rows = 0
+            gc_was_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                for row in reader:
+                    if max_rows is not None and len(data) >= max_rows:
+                        break
+                    if len(row) != width:
+                        # Skip malformed rows (reported once below rather than per row)
+                        skipped_rows += 1
+                        continue
                     
-                    # Try to convert numeric values
-                    if field in ["total_contributions", "followers", "public_repos", "stargazers_count", "forks_count"]:
-                        try:
-                            value = int(value) if value else 0
-                        except ValueError:
-                            value = 0
+                    values = [value.strip() for value in row]
+                    for i in int_columns:
+                        values[i] = _parse_int(values[i])
                     
-                    item[field] = value
-                
-                # Special handling for contributions
-                # Check if there's any field that might contain contribution data
-                # for i, field_name in enumerate(normalized_header):
-                #     if 'contribution' in field_name and row[i].strip():
-                #         try:
-                #             item['contributions'] = int(row[i].strip())
-                #             break
-                #         except ValueError:
-                #             pass
-                
-                data.append(item)
+                    data.append(dict(zip(normalized_header, values)))
+            finally:
+                if gc_was_enabled:
+                    gc.enable()
+            
+            if skipped_rows:
+                logging.warning(f"Skipped {skipped_rows} malformed rows in {file_path}")
             
             return data
     except Exception as e:
         logging.error(f"Error reading CSV file {file_path}: {e}")
         raise
 
+def _project_repositories(
+    repositories: Tuple[Dict[str, Any], ...]
+) -> Tuple[Tuple[Dict[str, Any], str, str, str], ...]:
+    """
+    Project repository rows onto the fields returned by /api/repositories.
+    
+    Each projected row is paired with its lowercased language, name and
+    description so case-insensitive filters don't lowercase them per request.
+    """
+    projected = []
+    for repo in repositories:
+        item = {field: repo.get(field) for field in REPOSITORY_FIELDS}
+        item["topics"] = _repository_topics(item["topics"])
+        projected.append((
+            item,
+            (item["language"] or "").lower(),
+            (item["name"] or "").lower(),
+            (item["description"] or "").lower()
+        ))
+    return tuple(projected)
+
+def _project_contributor(row: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Project a contributor row onto the Contributor fields, coerced the way the model would.
+    
+    Lets /api/contributors return plain dicts instead of validating every row
+    through the model on each request.
+    """
+    item = {field: row.get(field) for field in CONTRIBUTOR_FIELDS}
+    for field in CONTRIBUTOR_OPTIONAL_INT_FIELDS:
+        value = item[field]
+        if isinstance(value, str):
+            item[field] = _parse_int(value) if value.strip() else None
+    for field in CONTRIBUTOR_DATETIME_FIELDS:
+        # Timestamps are ISO 8601 from the GitHub API already; only blanks need mapping
+        item[field] = item[field] or None
+    site_admin = item["site_admin"]
+    if isinstance(site_admin, str):
+        item["site_admin"] = site_admin.strip().lower() in ("true", "1", "yes", "on") if site_admin.strip() else None
+    return item
+
+def _build_trigram_index(repository_rows: Tuple[Tuple[Dict[str, Any], str, str, str], ...]) -> Dict[str, Set[int]]:
+    """Map every 3-character substring of each repository's lowercased name and description to the rows containing it."""
+    index = defaultdict(set)
+    for position, (_, _, name_lc, description_lc) in enumerate(repository_rows):
+        for text in (name_lc, description_lc):
+            for i in range(len(text) - 2):
+                index[text[i:i + 3]].add(position)
+    return dict(index)
+
+def _sort_orders(
+    rows: Sequence[Dict[str, Any]],
+    sort_keys: Dict[str, Callable[[Dict[str, Any]], Any]]
+) -> Dict[Tuple[str, bool], array]:
+    """Precompute the row positions in sorted order for each supported sort field and direction."""
+    sort_orders = {}
+    for sort_by, sort_key in sort_keys.items():
+        # Compute each row's key once and sort the positions by looking it up
+        keys = [sort_key(row) for row in rows]
+        for reverse_sort in (False, True):
+            order = sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse_sort)
+            sort_orders[(sort_by, reverse_sort)] = array("q", order)
+    return sort_orders
+
+def _index_repositories(
+    repositories: Tuple[Dict[str, Any], ...]
+) -> Tuple[Tuple[Tuple[Dict[str, Any], str, str, str], ...], Dict[str, Set[int]], Dict[Tuple[str, bool], array]]:
+    """Project repository rows and build the keyword trigram index and sort orders over them."""
+    repository_rows = _project_repositories(repositories)
+    sort_orders = _sort_orders([entry[0] for entry in repository_rows], REPOSITORY_SORT_KEYS)
+    return repository_rows, _build_trigram_index(repository_rows), sort_orders
+
+def _keyword_candidates(trigram_index: Dict[str, Set[int]], keyword_lower: str) -> List[int]:
+    """
+    Get the positions of rows that may contain keyword_lower, in row order.
+    
+    Every trigram of the keyword must appear in the row, so this is a superset
+    of the actual matches; callers still check the substring. The keyword
+    must be at least 3 characters long.
+    """
+    postings = sorted(
+        (trigram_index.get(keyword_lower[i:i + 3], set()) for i in range(len(keyword_lower) - 2)),
+        key=len
+    )
+    return sorted(postings[0].intersection(*postings[1:]))
+
+def _compute_dashboard_stats(
+    repositories: Tuple[Dict[str, Any], ...],
+    contributors: Tuple[Dict[str, Any], ...]
+) -> Dict[str, Any]:
+    """Aggregate the /api/stats payload from already loaded rows."""
+    # Count unique repositories and contributors
+    unique_repos = set(repo.get("id", "") for repo in repositories)
+    unique_contributors = set(contrib.get("username", "") for contrib in contributors)
+    
+    # Aggregate languages and topics
+    languages_count = Counter(filter(None, (repo.get("language") for repo in repositories)))
+    topics_count = Counter(chain.from_iterable(_stats_topics(repo.get("topics")) for repo in repositories))
+    
+    top_languages = [
+        {"name": lang, "count": count}
+        for lang, count in languages_count.most_common(10)
+    ]
+    
+    top_topics = [
+        {"name": topic, "count": count}
+        for topic, count in topics_count.most_common(10)
+    ]
+    
+    # Top repositories by stars
+    repositories_by_stars = [
+        {
+            "name": repo.get("name", ""),
+            "full_name": repo.get("full_name", ""),
+            "stars": repo.get("stargazers_count", 0)
+        }
+        for repo in nlargest(10, repositories, key=lambda x: x.get("stargazers_count", 0))
+    ]
+    
+    # Top contributors by followers
+    contributors_by_followers = [
+        {
+            "username": contrib.get("username", ""),
+            "name": contrib.get("name", ""),
+            "followers": contrib.get("followers", 0)
+        }
+        for contrib in nlargest(10, contributors, key=lambda x: x.get("followers", 0))
+    ]
+    
+    return {
+        "total_repositories": len(unique_repos),
+        "total_contributors": len(unique_contributors),
+        "top_languages": top_languages,
+        "top_topics": top_topics,
+        "repositories_by_stars": repositories_by_stars,
+        "contributors_by_followers": contributors_by_followers
+    }
+
+def _compute_extended_stats(
+    repositories: Tuple[Dict[str, Any], ...],
+    contributors: Tuple[Dict[str, Any], ...]
+) -> Dict[str, Any]:
+    """Aggregate the statistics /api/stats/extended adds on top of /api/stats."""
+    # 1. Activity timeline - repositories created by month/year
+    # created_at is ISO 8601 (YYYY-MM-DDThh:mm:ssZ), so the month is just its first 7 characters
+    timeline = Counter(
+        created_at[:7] for created_at in (repo.get("created_at", "") for repo in repositories)
+        if len(created_at) >= 7 and created_at[4] == "-"
+    )
+    
+    # Convert to sorted list
+    activity_timeline = [
+        {"date": k, "count": v}
+        for k, v in sorted(timeline.items())
+    ]
+    
+    # 2. Repository size distribution
+    # Size is parsed as an integer number of KB at load time, so bisect it into
+    # the KB bucket bounds instead of converting each row to MB
+    size_counts = Counter(bisect_right(SIZE_BUCKET_BOUNDS_KB, repo.get("size") or 0) for repo in repositories)
+    
+    size_distribution = [
+        {"category": label, "count": size_counts[i]}
+        for i, label in enumerate(SIZE_BUCKET_LABELS)
+    ]
+    
+    # 3. Contributors with company affiliations
+    companies = Counter(
+        company for company in (contrib.get("company", "") for contrib in contributors)
+        if company and company.lower() not in NULL_STRINGS
+    )
+    
+    top_companies = [
+        {"name": k, "count": v}
+        for k, v in companies.most_common(10)
+    ]
+    
+    return {
+        "activity_timeline": activity_timeline,
+        "size_distribution": size_distribution,
+        "top_companies": top_companies
+    }
+
+def get_cached_result(key: str, file_paths: Sequence[Path], compute: Callable[[], Any]) -> Any:
+    """
+    Get a result derived from data files, recomputing it only when one of them changes.
+    
+    Args:
+        key: Name the result is cached under
+        file_paths: Data files the result is computed from
+        compute: Function that computes the result
+        
+    Returns:
+        The cached or freshly computed result
+    """
+    signature = get_files_signature(*file_paths)
+    cached = _RESULT_CACHE.get(key)
+    if cached and cached[0] == signature:
+        return cached[1]
+    
+    result = compute()
+    _RESULT_CACHE[key] = (signature, result)
+    return result
+
+def _group_contributor_repositories(contributors_data: Tuple[Dict[str, Any], ...]) -> List[Dict[str, Any]]:
+    """Group contributor rows by username, sorted by number of repositories (descending)."""
+    contributor_repos = {}
+    for contrib in contributors_data:
+        username = contrib.get("username")
+        repo = contrib.get("repository")
+        
+        if not username or not repo:
+            continue
+            
+        if username not in contributor_repos:
+            contributor_repos[username] = {
+                "username": username,
+                "name": contrib.get("name", ""),
+                "repositories": set(),
+                "total_contributions": 0,
+                "followers": contrib.get("followers", 0),
+                "location": contrib.get("location", "Unknown"),
+                "company": contrib.get("company", ""),
+                "html_url": contrib.get("html_url", "")
+            }
+        
+        contributor_repos[username]["repositories"].add(repo)
+        # contributor_repos[username]["total_contributions"] += int(contrib.get("contributions", 0))
+    
+    grouped_contributors = [
+        {
+            **contrib,
+            "repositories": list(contrib["repositories"]),
+            "repository_count": len(contrib["repositories"])
+        }
+        for contrib in contributor_repos.values()
+    ]
+    grouped_contributors.sort(key=lambda x: x["repository_count"], reverse=True)
+    return grouped_contributors
+
+def _group_contributors_by_location(contributors_data: Tuple[Dict[str, Any], ...]) -> List[Dict[str, Any]]:
+    """Group contributors by location, largest locations first."""
+    # Group contributors by location, tracking usernames already counted per location
+    locations = {}
+    seen_usernames = {}
+    for contrib in contributors_data:
+        location = contrib.get("location", "Unknown")
+        if not location or location.lower() in NULL_STRINGS:
+            location = "Unknown"
+        
+        if location not in locations:
+            locations[location] = {
+                "location": location,
+                "count": 0,
+                "contributors": []
+            }
+            seen_usernames[location] = set()
+        
+        # Check if this contributor is already counted
+        username = contrib.get("username")
+        if username not in seen_usernames[location]:
+            seen_usernames[location].add(username)
+            locations[location]["count"] += 1
+            locations[location]["contributors"].append({
+                "username": username,
+                "name": contrib.get("name", ""),
+                "followers": contrib.get("followers", 0),
+                "total_contributions": contrib.get("total_contributions", 0),
+                "repository": contrib.get("repository", ""),
+                "html_url": contrib.get("html_url", "")
+            })
+    
+    # Convert to list and sort by count
+    location_list = list(locations.values())
+    location_list.sort(key=lambda x: x["count"], reverse=True)
+    
+    return location_list
+
+def _index_contributors_by_username(contributors_data: Tuple[Dict[str, Any], ...]) -> Dict[str, List[Dict[str, Any]]]:
+    """Map each username to its contributor rows, in file order."""
+    contributors_by_username = defaultdict(list)
+    for contrib in contributors_data:
+        contributors_by_username[contrib.get("username")].append(contrib)
+    return dict(contributors_by_username)
+
+def get_contributor_entries(files: Dict[str, Path], username: str) -> List[Dict[str, Any]]:
+    """Get the contributor rows for a username through the cached username index."""
+    contributors_by_username = get_cached_result(
+        "contributors_by_username",
+        (files["contributors"],),
+        lambda: _index_contributors_by_username(read_csv_file(files["contributors"]))
+    )
+    return contributors_by_username.get(username, [])
+
+def get_repositories_by_name(files: Dict[str, Path], file_key: str) -> Dict[str, Dict[str, Any]]:
+    """Map full_name to repository row for one of the repositories files, cached per file version."""
+    file_path = files[file_key]
+    return get_cached_result(
+        f"{file_key}_by_name",
+        (file_path,),
+        lambda: {repo.get("full_name"): repo for repo in read_csv_file(file_path)}
+    )
+
+def _count_candidate_languages(repos_data: Tuple[Dict[str, Any], ...]) -> List[Dict[str, Any]]:
+    """Count repositories per language, most common first."""
+    languages = Counter(
+        lang for lang in (repo.get("language") for repo in repos_data)
+        if lang and lang.lower() not in NULL_STRINGS
+    )
+    return [{"name": lang, "count": count} for lang, count in languages.most_common()]
+
+def _count_candidate_locations(contributors_data: Tuple[Dict[str, Any], ...]) -> List[Dict[str, Any]]:
+    """Count contributor rows per location, most common first."""
+    locations = Counter(
+        location for location in (c.get("location") for c in contributors_data)
+        if location and location.lower() not in NULL_STRINGS
+    )
+    return [{"name": loc, "count": count} for loc, count in locations.most_common()]
+
+def _index_contributors_by_repository(
+    contributors_data: Tuple[Dict[str, Any], ...]
+) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, List[Tuple[Dict[str, Any], Dict[str, Any]]]]]:
+    """
+    Index contributor rows by the repositories they contributed to, in file order.
+    
+    Returns:
+        A map from the repository column to its rows, and a map from each repository
+        named in repository_contributions to (row, repository contribution) pairs
+    """
+    by_direct_repo = defaultdict(list)
+    by_json_repo = defaultdict(list)
+    for contributor in contributors_data:
+        by_direct_repo[contributor.get("repository")].append(contributor)
+        for repo_data in _parse_repository_contributions(contributor.get("repository_contributions")):
+            if isinstance(repo_data, dict):
+                by_json_repo[repo_data.get("repository")].append((contributor, repo_data))
+    return dict(by_direct_repo), dict(by_json_repo)
+
+def _sorted_page(
+    items: List[Dict[str, Any]],
+    sort_key: Optional[Callable[[Dict[str, Any]], Any]],
+    reverse_sort: bool,
+    start_idx: int,
+    end_idx: int
+) -> List[Dict[str, Any]]:
+    """
+    Get sorted(items, key=sort_key, reverse=reverse_sort)[start_idx:end_idx].
+    
+    Only the first end_idx items are selected (a partial sort) rather than
+    sorting them all. Without a sort key the items keep their order.
+    """
+    if sort_key is None:
+        return items[start_idx:end_idx]
+    if start_idx < 0 or end_idx < 0:
+        return sorted(items, key=sort_key, reverse=reverse_sort)[start_idx:end_idx]
+    select = nlargest if reverse_sort else nsmallest
+    return select(end_idx, items, key=sort_key)[start_idx:]
+
+def _int_column(rows: Tuple[Dict[str, Any], ...], field: str) -> array:
+    """Pack one int column of the rows into a compact array (0 where the value is missing)."""
+    return array('q', (row.get(field) or 0 for row in rows))
+
+def _casefold_locations(contributors_data: Tuple[Dict[str, Any], ...]) -> Tuple[str, ...]:
+    """Casefolded location of each contributor row, for the candidate location filter."""
+    return tuple((c.get("location") or "").casefold() for c in contributors_data)
+
+def _lowercase_repository_languages(
+    contributors_data: Tuple[Dict[str, Any], ...],
+    repos_by_name: Dict[str, Dict[str, Any]]
+) -> Tuple[Optional[str], ...]:
+    """Lowercased language of each contributor row's repository (None if it isn't known)."""
+    languages = []
+    for c in contributors_data:
+        repo = repos_by_name.get(c.get("repository"))
+        languages.append((repo.get("language") or "").lower() if repo is not None else None)
+    return tuple(languages)
+
+def _fetch_github_user_repos(username: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    Fetch a user's repositories from the GitHub API, or None if the request fails.
+    
+    Responses are reused for GITHUB_REPOS_CACHE_TTL seconds and then revalidated
+    with If-None-Match; a 304 (which doesn't count against the rate limit)
+    keeps the cached list.
+    """
+    with _GITHUB_FETCH_LOCKS[hash(username) % GITHUB_FETCH_LOCK_STRIPES]:
+        with _GITHUB_REPOS_CACHE_LOCK:
+            cached = _GITHUB_REPOS_CACHE.get(username)
+            if cached:
+                _GITHUB_REPOS_CACHE.move_to_end(username)
+        if cached and time.monotonic() - cached[0] < GITHUB_REPOS_CACHE_TTL:
+            return cached[2]
+        
+        headers = {}
+        github_token = os.environ.get("GITHUB_TOKEN")
+        if github_token:
+            headers["Authorization"] = f"token {github_token}"
+        if cached and cached[1]:
+            headers["If-None-Match"] = cached[1]
+        
+        api_url = f"https://api.github.com/users/{username}/repos?per_page=100&sort=updated"
+        response = _GITHUB_SESSION.get(api_url, headers=headers, timeout=GITHUB_API_TIMEOUT)
+        
+        if response.status_code == 304 and cached:
+            _store_github_user_repos(username, (time.monotonic(), cached[1], cached[2]))
+            return cached[2]
+        if response.status_code != 200:
+            logging.error(f"Failed to fetch repositories from GitHub API: {response.status_code}")
+            return None
+        
+        repos_data = response.json()
+        _store_github_user_repos(username, (time.monotonic(), response.headers.get("ETag", ""), repos_data))
+        return repos_data
+
+def _store_github_user_repos(username: str, entry: Tuple[float, str, List[Dict[str, Any]]]) -> None:
+    """Cache a user's repository list, evicting the least recently used users beyond the cache size."""
+    with _GITHUB_REPOS_CACHE_LOCK:
+        _GITHUB_REPOS_CACHE[username] = entry
+        _GITHUB_REPOS_CACHE.move_to_end(username)
+        while len(_GITHUB_REPOS_CACHE) > GITHUB_REPOS_CACHE_SIZE:
+            _GITHUB_REPOS_CACHE.popitem(last=False)
+
+def get_cached_dashboard_stats(files: Dict[str, Path]) -> Dict[str, Any]:
+    """Get the /api/stats payload, reusing the last result while the source files are unchanged."""
+    return get_cached_result(
+        "dashboard_stats",
+        (files["repositories_detailed"], files["contributors"]),
+        lambda: _compute_dashboard_stats(
+            read_csv_file(files["repositories_detailed"]),
+            read_csv_file(files["contributors"])
+        )
+    )
+
 # API Routes
 @app.get("/")
 async def root():
     return {"message": "GitHub Data Dashboard API"}
 
 @app.get("/api/repositories", response_model=List[Repository])
-async def get_repositories(
+def get_repositories(
     limit: int = Query(20, description="Number of repositories to return"),
     offset: int = Query(0, description="Offset for pagination"),
     sort_by: str = Query("stargazers_count", description="Field to sort by"),
@@ -197,95 +906,85 @@ async def get_repositories(
 ):
     """Get a list of repositories."""
     try:
-        repositories = read_csv_file(get_latest_data_files()["repositories_detailed"])
-        
-        # Apply filters
-        if language:
-            repositories = [
-                r for r in repositories 
-                if r.get("language") and r.get("language").lower() == language.lower()
-            ]
-            
-        if min_stars is not None:
-            repositories = [
-                r for r in repositories
-                if r.get("stargazers_count") and int(r.get("stargazers_count", 0)) >= min_stars
-            ]
-            
-        if keyword:
-            repositories = [
-                r for r in repositories
-                if (r.get("name") and keyword.lower() in r.get("name", "").lower()) or
-                   (r.get("description") and keyword.lower() in r.get("description", "").lower())
-            ]
+        # Lowercase the filter values once instead of once per row
+        language_lower = language.lower() if language else None
+        keyword_lower = keyword.lower() if keyword else None
+        
+        def matches_filters(entry: Tuple[Dict[str, Any], str, str, str]) -> bool:
+            r, language_lc, name_lc, description_lc = entry
+            if language_lower and language_lc != language_lower:
+                return False
+            if min_stars is not None and not (r["stargazers_count"] and r["stargazers_count"] >= min_stars):
+                return False
+            if keyword_lower and not (keyword_lower in name_lc or keyword_lower in description_lc):
+                return False
+            return True
+        
+        # Rows are projected (with their lowercased search fields) and indexed once per version of the file
+        files = get_latest_data_files()
+        repository_rows, trigram_index, sort_orders = get_cached_result(
+            "repository_rows",
+            (files["repositories_detailed"],),
+            lambda: _index_repositories(read_csv_file(files["repositories_detailed"]))
+        )
         
-        # Sort the results
         reverse_sort = sort_order.lower() == "desc"
-        
-        if sort_by == "stargazers_count":
-            repositories.sort(
-                key=lambda x: int(x.get("stargazers_count", 0)), 
-                reverse=reverse_sort
+        sort_key = REPOSITORY_SORT_KEYS.get(sort_by)
+        # Only the first offset+limit matches in sort order are needed for the page
+        page_end = offset + limit if offset >= 0 and limit >= 0 else None
+        
+        if keyword_lower and len(keyword_lower) >= 3:
+            # Narrow keyword searches to the rows containing all of the keyword's trigrams,
+            # then filter and sort those candidates
+            matches = (
+                entry[0] for entry in (repository_rows[i] for i in _keyword_candidates(trigram_index, keyword_lower))
+                if matches_filters(entry)
             )
-        elif sort_by == "forks_count":
-            repositories.sort(
-                key=lambda x: int(x.get("forks_count", 0)), 
-                reverse=reverse_sort
-            )
-        elif sort_by == "updated_at":
-            repositories.sort(
-                key=lambda x: x.get("updated_at", ""), 
-                reverse=reverse_sort
-            )
-        
-        # Process topics field for each repository
-        for repo in repositories:
-            # Convert topics from string to list
-            if "topics" in repo:
-                try:
-                    if isinstance(repo["topics"], str):
-                        # If it's a string that looks like a JSON array, parse it
-                        if repo["topics"].startswith("[") and repo["topics"].endswith("]"):
-                            try:
-                                repo["topics"] = json.loads(repo["topics"])
-                            except json.JSONDecodeError:
-                                # If JSON parsing fails, split by commas and strip quotes
-                                topics_str = repo["topics"].strip("[]")
-                                repo["topics"] = [t.strip(' "\'') for t in topics_str.split(",") if t.strip()]
-                        else:
-                            # Otherwise, just use it as a single-item list
-                            repo["topics"] = [repo["topics"]] if repo["topics"] else []
-                except Exception as e:
-                    logging.error(f"Error processing topics for repo {repo.get('full_name')}: {e}")
-                    repo["topics"] = []
+            if sort_key and page_end is not None:
+                # Partial sort: keep just the leading page_end matches instead of sorting them all
+                select = nlargest if reverse_sort else nsmallest
+                paginated_repos = select(page_end, matches, key=sort_key)[offset:]
             else:
-                repo["topics"] = []
-        
-        # Apply pagination
-        paginated_repos = repositories[offset:offset+limit]
+                repositories = list(matches)
+                if sort_key:
+                    repositories.sort(key=sort_key, reverse=reverse_sort)
+                paginated_repos = repositories[offset:offset+limit]
+        else:
+            # Walk the rows in their precomputed sort order, so the matches come out already sorted
+            order = sort_orders[(sort_by, reverse_sort)] if sort_key else range(len(repository_rows))
+            if language_lower or min_stars is not None or keyword_lower:
+                matches = (repository_rows[i][0] for i in order if matches_filters(repository_rows[i]))
+                if page_end is not None:
+                    # Stop walking as soon as the requested page is filled
+                    paginated_repos = list(islice(matches, offset, page_end))
+                else:
+                    paginated_repos = list(matches)[offset:offset+limit]
+            else:
+                # Without filters only the requested page needs to be materialized
+                paginated_repos = [repository_rows[i][0] for i in order[offset:offset+limit]]
         
-        return paginated_repos
+        # The rows are already typed and projected, so return them directly instead of
+        # validating each one through the Repository model (response_model still documents it)
+        return JSONResponse(content=paginated_repos)
         
     except Exception as e:
         logging.exception(f"Error fetching repositories: {e}")
         raise HTTPException(status_code=500, detail=f"Error fetching repositories: {str(e)}")
 
 @app.get("/api/contributors", response_model=List[Contributor])
-async def get_contributors(limit: int = 20) -> List[Contributor]:
+def get_contributors(limit: int = 20):
     """Get a list of contributors with flattened repository contributions."""
     try:
         files = get_latest_data_files()
-        contributors_data = read_csv_file(files["contributors"])
+        # Only the first rows are returned, so don't load the whole file just for them
+        contributors_data = read_csv_file(files["contributors"], max_rows=limit if limit >= 0 else None)
         flattened_contributors: List[Dict[str, Any]] = []
         
-        for row in contributors_data:
+        for row in contributors_data[:limit]:
+            row = _project_contributor(row)
+            
             # Process the 'repository_contributions' field to extract required values.
-            repo_contribs = []
-            if "repository_contributions" in row and row["repository_contributions"]:
-                try:
-                    repo_contribs = json.loads(row["repository_contributions"])
-                except json.JSONDecodeError:
-                    repo_contribs = []
+            repo_contribs = _parse_repository_contributions(row.get("repository_contributions"))
             
             if repo_contribs:
                 # Use the first repository contribution as the primary one.
@@ -300,7 +999,9 @@ async def get_contributors(limit: int = 20) -> List[Contributor]:
             
             flattened_contributors.append(row)
         
-        return flattened_contributors[:limit]
+        # Rows are already projected and coerced to the Contributor fields, so return them
+        # directly (keeping the flattened contribution fields the dashboard's table shows)
+        return JSONResponse(content=flattened_contributors)
     
     except HTTPException:
         raise
@@ -309,98 +1010,20 @@ async def get_contributors(limit: int = 20) -> List[Contributor]:
         raise HTTPException(status_code=500, detail=f"Error fetching contributors: {e}")
 
 @app.get("/api/stats", response_model=DashboardStats)
-async def get_dashboard_stats():
+def get_dashboard_stats(request: Request):
     """Get aggregated statistics for the dashboard."""
     try:
         files = get_latest_data_files()
-        repositories = read_csv_file(files["repositories_detailed"])
-        contributors = read_csv_file(files["contributors"])
-        
-        # Count unique repositories and contributors
-        unique_repos = set(repo.get("id", "") for repo in repositories)
-        unique_contributors = set(contrib.get("username", "") for contrib in contributors)
-        
-        # Aggregate languages
-        languages_count = {}
-        for repo in repositories:
-            lang = repo.get("language")
-            if lang:
-                languages_count[lang] = languages_count.get(lang, 0) + 1
-        
-        top_languages = [
-            {"name": lang, "count": count}
-            for lang, count in sorted(languages_count.items(), key=lambda x: x[1], reverse=True)
-        ][:10]
-        
-        # Aggregate topics with enhanced type checking and logging
-        topics_count = {}
-        for repo in repositories:
-            raw_topics = repo.get("topics")
-            cleaned_topics = []
-            if raw_topics is None:
-                cleaned_topics = []
-            elif isinstance(raw_topics, list):
-                cleaned_topics = raw_topics
-            elif isinstance(raw_topics, str):
-                try:
-                    parsed = json.loads(raw_topics)
-                    if isinstance(parsed, list):
-                        cleaned_topics = parsed
-                    else:
-                        cleaned_topics = []
-                        logging.warning(
-                            "Repository %s: topics after JSON parsing is not a list: %s",
-                            repo.get("id"), parsed
-                        )
-                except json.JSONDecodeError:
-                    cleaned_topics = []
-                    logging.warning(
-                        "Repository %s: failed to decode topics JSON from: %s",
-                        repo.get("id"), raw_topics
-                    )
-            else:
-                cleaned_topics = []
-                logging.warning(
-                    "Repository %s: topics has unexpected type %s: %s",
-                    repo.get("id"), type(raw_topics), raw_topics
-                )
-            
-            for topic in cleaned_topics:
-                topics_count[topic] = topics_count.get(topic, 0) + 1
-        
-        top_topics = [
-            {"name": topic, "count": count}
-            for topic, count in sorted(topics_count.items(), key=lambda x: x[1], reverse=True)
-        ][:10]
-        
-        # Top repositories by stars
-        repositories_by_stars = [
-            {
-                "name": repo.get("name", ""),
-                "full_name": repo.get("full_name", ""),
-                "stars": repo.get("stargazers_count", 0)
-            }
-            for repo in sorted(repositories, key=lambda x: x.get("stargazers_count", 0), reverse=True)
-        ][:10]
         
-        # Top contributors by followers
-        contributors_by_followers = [
-            {
-                "username": contrib.get("username", ""),
-                "name": contrib.get("name", ""),
-                "followers": contrib.get("followers", 0)
-            }
-            for contrib in sorted(contributors, key=lambda x: x.get("followers", 0), reverse=True)
-        ][:10]
+        # The stats only change with the data files, so let clients revalidate with an ETag
+        etag = get_files_etag(files["repositories_detailed"], files["contributors"])
+        if etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
         
-        return {
-            "total_repositories": len(unique_repos),
-            "total_contributors": len(unique_contributors),
-            "top_languages": top_languages,
-            "top_topics": top_topics,
-            "repositories_by_stars": repositories_by_stars,
-            "contributors_by_followers": contributors_by_followers
-        }
+        return JSONResponse(
+            content=get_cached_dashboard_stats(files),
+            headers={"ETag": etag, "Cache-Control": STATS_CACHE_CONTROL}
+        )
     
     except HTTPException:
         raise
@@ -409,187 +1032,78 @@ async def get_dashboard_stats():
         raise HTTPException(status_code=500, detail=f"Error fetching dashboard stats: {str(e)}")
 
 @app.get("/api/contributors/multi-repo", response_model=List[Dict[str, Any]])
-async def get_multi_repo_contributors(min_repos: int = 2):
+def get_multi_repo_contributors(min_repos: int = 2):
     """Get contributors who contribute to multiple repositories."""
     try:
-        contributors_data = read_csv_file(get_latest_data_files()["contributors"])
-        
-        # Group contributors by username and count repositories
-        contributor_repos = {}
-        for contrib in contributors_data:
-            username = contrib.get("username")
-            repo = contrib.get("repository")
-            
-            if not username or not repo:
-                continue
-                
-            if username not in contributor_repos:
-                contributor_repos[username] = {
-                    "username": username,
-                    "name": contrib.get("name", ""),
-                    "repositories": set(),
-                    "total_contributions": 0,
-                    "followers": contrib.get("followers", 0),
-                    "location": contrib.get("location", "Unknown"),
-                    "company": contrib.get("company", ""),
-                    "html_url": contrib.get("html_url", "")
-                }
-            
-            contributor_repos[username]["repositories"].add(repo)
-            # contributor_repos[username]["total_contributions"] += int(contrib.get("contributions", 0))
-        
-        # Filter contributors with multiple repositories
-        multi_repo_contributors = [
-            {
-                **contrib,
-                "repositories": list(contrib["repositories"]),
-                "repository_count": len(contrib["repositories"])
-            }
-            for contrib in contributor_repos.values()
-            if len(contrib["repositories"]) >= min_repos
-        ]
-        
-        # Sort by number of repositories (descending)
-        multi_repo_contributors.sort(key=lambda x: x["repository_count"], reverse=True)
-        
-        return multi_repo_contributors
+        files = get_latest_data_files()
+        grouped_contributors = get_cached_result(
+            "contributors_by_repository_count",
+            (files["contributors"],),
+            lambda: _group_contributor_repositories(read_csv_file(files["contributors"]))
+        )
+        
+        # Grouped contributors are sorted by repository count, so stop at the first one below min_repos
+        multi_repo_contributors = list(takewhile(lambda c: c["repository_count"] >= min_repos, grouped_contributors))
+        
+        # The grouped rows are already JSON-ready, so serialize them directly instead of
+        # re-validating every one against the response model
+        return JSONResponse(content=multi_repo_contributors)
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching multi-repo contributors: {str(e)}")
 
 @app.get("/api/contributors/by-location", response_model=List[Dict[str, Any]])
-async def get_contributors_by_location():
+def get_contributors_by_location():
     """Get contributors grouped by location."""
     try:
-        contributors_data = read_csv_file(get_latest_data_files()["contributors"])
-        
-        # Group contributors by location
-        locations = {}
-        for contrib in contributors_data:
-            location = contrib.get("location", "Unknown")
-            if not location or location.lower() in ["null", "none", ""]:
-                location = "Unknown"
-            
-            if location not in locations:
-                locations[location] = {
-                    "location": location,
-                    "count": 0,
-                    "contributors": []
-                }
-            
-            # Check if this contributor is already counted
-            username = contrib.get("username")
-            if not any(c.get("username") == username for c in locations[location]["contributors"]):
-                locations[location]["count"] += 1
-                locations[location]["contributors"].append({
-                    "username": username,
-                    "name": contrib.get("name", ""),
-                    "followers": contrib.get("followers", 0),
-                    "total_contributions": contrib.get("total_contributions", 0),
-                    "repository": contrib.get("repository", ""),
-                    "html_url": contrib.get("html_url", "")
-                })
-        
-        # Convert to list and sort by count
-        location_list = list(locations.values())
-        location_list.sort(key=lambda x: x["count"], reverse=True)
-        
-        return location_list
+        files = get_latest_data_files()
+        location_list = get_cached_result(
+            "contributors_by_location",
+            (files["contributors"],),
+            lambda: _group_contributors_by_location(read_csv_file(files["contributors"]))
+        )
+        
+        # The grouping is already JSON-ready, so serialize it directly instead of
+        # re-validating every contributor dict against the response model
+        return JSONResponse(content=location_list)
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching contributors by location: {str(e)}")
 
 @app.get("/api/stats/extended", response_model=Dict[str, Any])
-async def get_extended_stats():
+def get_extended_stats(request: Request):
     """Get extended dashboard statistics."""
     try:
-        repositories = read_csv_file(get_latest_data_files()["repositories_detailed"])
-        contributors = read_csv_file(get_latest_data_files()["contributors"])
-        
-        # Basic stats from the original endpoint
-        basic_stats = await get_dashboard_stats()
-        
-        # Additional stats
-        
-        # 1. Activity timeline - repositories created by month/year
-        timeline = {}
-        for repo in repositories:
-            created_at = repo.get("created_at", "")
-            if created_at:
-                try:
-                    date = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                    month_year = date.strftime("%Y-%m")
-                    
-                    if month_year not in timeline:
-                        timeline[month_year] = 0
-                    timeline[month_year] += 1
-                except:
-                    pass
-        
-        # Convert to sorted list
-        activity_timeline = [
-            {"date": k, "count": v}
-            for k, v in sorted(timeline.items())
-        ]
-        
-        # 2. Repository size distribution
-        size_ranges = {
-            "Small (<1MB)": 0,
-            "Medium (1-10MB)": 0,
-            "Large (10-100MB)": 0,
-            "Very Large (>100MB)": 0
-        }
-        
-        for repo in repositories:
-            # Convert size to integer, handling the case where it's a string
-            try:
-                size_kb = int(repo.get("size", 0))
-            except (ValueError, TypeError):
-                size_kb = 0
-                
-            size_mb = size_kb / 1024  # Convert KB to MB
-            
-            if size_mb < 1:
-                size_ranges["Small (<1MB)"] += 1
-            elif size_mb < 10:
-                size_ranges["Medium (1-10MB)"] += 1
-            elif size_mb < 100:
-                size_ranges["Large (10-100MB)"] += 1
-            else:
-                size_ranges["Very Large (>100MB)"] += 1
-        
-        size_distribution = [
-            {"category": k, "count": v}
-            for k, v in size_ranges.items()
-        ]
-        
-        # 3. Contributors with company affiliations
-        companies = {}
-        for contrib in contributors:
-            company = contrib.get("company", "")
-            if company and company.lower() not in ["null", "none", ""]:
-                if company not in companies:
-                    companies[company] = 0
-                companies[company] += 1
-        
-        top_companies = [
-            {"name": k, "count": v}
-            for k, v in sorted(companies.items(), key=lambda x: x[1], reverse=True)
-        ][:10]
+        files = get_latest_data_files()
         
-        return {
-            **basic_stats,
-            "activity_timeline": activity_timeline,
-            "size_distribution": size_distribution,
-            "top_companies": top_companies
-        }
+        etag = get_files_etag(files["repositories_detailed"], files["contributors"])
+        if etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        
+        # Both parts are computed once per version of the data files
+        extended_stats = get_cached_result(
+            "extended_stats",
+            (files["repositories_detailed"], files["contributors"]),
+            lambda: _compute_extended_stats(
+                read_csv_file(files["repositories_detailed"]),
+                read_csv_file(files["contributors"])
+            )
+        )
+        
+        return JSONResponse(
+            content={
+                **get_cached_dashboard_stats(files),
+                **extended_stats
+            },
+            headers={"ETag": etag, "Cache-Control": STATS_CACHE_CONTROL}
+        )
     
     except Exception as e:
         logging.exception(f"Error fetching extended stats: {e}")
         raise HTTPException(status_code=500, detail=f"Error fetching extended stats: {str(e)}")
 
 @app.get("/api/debug/file-structure", response_model=Dict[str, Any])
-async def debug_file_structure():
+def debug_file_structure():
     """Debug endpoint to check the structure of the data files."""
     try:
         files = get_latest_data_files()
@@ -620,16 +1134,11 @@ async def debug_file_structure():
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
 
 @app.get("/api/debug/contributor/{username}", response_model=Dict[str, Any])
-async def debug_contributor_data(username: str):
+def debug_contributor_data(username: str):
     """Debug endpoint to get raw contributor data."""
     try:
-        contributors_data = read_csv_file(get_latest_data_files()["contributors"])
-        
-        # Filter contributors by username
-        contributor_entries = [
-            c for c in contributors_data 
-            if c.get("username") == username
-        ]
+        # Look up the contributor's rows in the username index instead of scanning every row
+        contributor_entries = get_contributor_entries(get_latest_data_files(), username)
         
         if not contributor_entries:
             raise HTTPException(status_code=404, detail=f"Contributor {username} not found")
@@ -662,7 +1171,7 @@ async def debug_contributor_data(username: str):
         raise HTTPException(status_code=500, detail=f"Error fetching debug data: {str(e)}")
 
 @app.get("/api/contributors/{username}", response_model=Dict[str, Any])
-async def get_contributor_details(
+def get_contributor_details(
     username: str,
     page: int = Query(1, description="Page number"),
     page_size: int = Query(20, description="Number of results per page"),
@@ -671,16 +1180,12 @@ async def get_contributor_details(
 ):
     """Get detailed information about a contributor and their repositories."""
     try:
-        contributors_data = read_csv_file(get_latest_data_files()["contributors"])
-        
         # Log the username we're looking for
         logging.info(f"Looking for contributor with username: {username}")
         
-        # Filter contributors by username
-        contributor_entries = [
-            c for c in contributors_data 
-            if c.get("username") == username
-        ]
+        # Look up the contributor's rows in the username index instead of scanning every row
+        files = get_latest_data_files()
+        contributor_entries = get_contributor_entries(files, username)
         
         # Log how many entries we found
         logging.info(f"Found {len(contributor_entries)} entries for contributor {username}")
@@ -697,47 +1202,25 @@ async def get_contributor_details(
         
         # Check for repository_contributions field which contains JSON data
         for entry in contributor_entries:
-            repo_contributions = entry.get("repository_contributions")
-            if repo_contributions:
-                try:
-                    # Log the raw repository_contributions field
-                    logging.info(f"Raw repository_contributions: {repo_contributions}")
+            for repo_data in _parse_repository_contributions(entry.get("repository_contributions")):
+                if isinstance(repo_data, dict) and "repository" in repo_data:
+                    # The field is named "contributions" in the JSON
+                    contributions = _parse_int(repo_data.get("contributions"))
+                    logging.debug("Found contributions: %s for repo %s", contributions, repo_data["repository"])
                     
-                    # Try to parse as JSON
-                    if isinstance(repo_contributions, str):
-                        repo_data_list = json.loads(repo_contributions)
-                        logging.info(f"Successfully parsed repository_contributions as JSON: {repo_data_list}")
-                        
-                        if isinstance(repo_data_list, list):
-                            for repo_data in repo_data_list:
-                                if isinstance(repo_data, dict) and "repository" in repo_data:
-                                    # Ensure contributions is an integer
-                                    contributions = 0
-                                    try:
-                                        # The field is named "contributions" in the JSON
-                                        contributions = int(repo_data.get("contributions", 0))
-                                        logging.info(f"Found contributions: {contributions} for repo {repo_data['repository']}")
-                                    except (ValueError, TypeError):
-                                        pass
-                                    
-                                    # Create repository entry
-                                    repo_entry = {
-                                        "repository": repo_data["repository"],
-                                        "contributions": contributions
-                                    }
-                                    
-                                    # Add additional fields if available
-                                    if "repository_stars" in repo_data:
-                                        repo_entry["stars"] = repo_data["repository_stars"]
-                                    if "repository_language" in repo_data:
-                                        repo_entry["language"] = repo_data["repository_language"]
-                                    
-                                    contributor_repos.append(repo_entry)
-                                    logging.info(f"Added repository from JSON: {repo_data['repository']} with {contributions} contributions")
-                except json.JSONDecodeError as e:
-                    logging.error(f"Error parsing repository_contributions as JSON: {e}")
-                except Exception as e:
-                    logging.error(f"Unexpected error parsing repository_contributions: {e}")
+                    # Create repository entry, with its numeric fields coerced up front
+                    repo_entry = {
+                        "repository": repo_data["repository"],
+                        "contributions": contributions,
+                        "stars": _parse_int(repo_data.get("repository_stars"))
+                    }
+                    
+                    # Add additional fields if available
+                    if "repository_language" in repo_data:
+                        repo_entry["language"] = repo_data["repository_language"]
+                    
+                    contributor_repos.append(repo_entry)
+                    logging.debug("Added repository from JSON: %s with %s contributions", repo_data["repository"], contributions)
         
         # If no repositories found from repository_contributions, try other methods
         if not contributor_repos:
@@ -748,18 +1231,13 @@ async def get_contributor_details(
                 repo_name = entry.get("repository")
                 if repo_name:
                     # Log the repository we found
-                    logging.info(f"Found repository {repo_name} for contributor {username}")
-                    
-                    # Get contributions for this repo
-                    contributions = 0
-                    try:
-                        contributions = int(entry.get("contributions", 0))
-                    except (ValueError, TypeError):
-                        pass
+                    logging.debug("Found repository %s for contributor %s", repo_name, username)
                     
+                    # Contributions are already ints from load time
                     contributor_repos.append({
                         "repository": repo_name,
-                        "contributions": contributions
+                        "contributions": entry.get("contributions", 0),
+                        "stars": 0
                     })
             
             # If still no repositories, try to fetch from GitHub API
@@ -767,19 +1245,10 @@ async def get_contributor_details(
                 logging.info(f"No repositories found in data, trying to fetch from GitHub API")
                 
                 try:
-                    # Fetch repositories from GitHub API
-                    github_token = os.environ.get("GITHUB_TOKEN")
-                    headers = {}
-                    if github_token:
-                        headers["Authorization"] = f"token {github_token}"
-                    
-                    # Make the API request
-                    api_url = f"https://api.github.com/users/{username}/repos?per_page=100&sort=updated"
-                    response = requests.get(api_url, headers=headers)
+                    # Fetch repositories from GitHub API (cached and revalidated per username)
+                    repos_data = _fetch_github_user_repos(username)
                     
-                    if response.status_code == 200:
-                        repos_data = response.json()
-                        
+                    if repos_data is not None:
                         # Process each repository
                         for repo_data in repos_data:
                             # Only include repositories owned by the user
@@ -787,15 +1256,13 @@ async def get_contributor_details(
                                 contributor_repos.append({
                                     "repository": repo_data.get("full_name"),
                                     "contributions": 0,  # We don't know the exact contributions
-                                    "stars": repo_data.get("stargazers_count", 0),
+                                    "stars": _parse_int(repo_data.get("stargazers_count")),
                                     "forks": repo_data.get("forks_count", 0),
                                     "language": repo_data.get("language", ""),
                                     "description": repo_data.get("description", "")
                                 })
                         
                         logging.info(f"Fetched {len(contributor_repos)} repositories from GitHub API")
-                    else:
-                        logging.error(f"Failed to fetch repositories from GitHub API: {response.status_code}")
                 except Exception as e:
                     logging.error(f"Error fetching repositories from GitHub API: {e}")
         
@@ -822,58 +1289,38 @@ async def get_contributor_details(
         # Log the total number of repositories found
         logging.info(f"Total repositories found for {username}: {len(contributor_repos)}")
         
-        # Ensure numeric fields
-        for repo in contributor_repos:
-            # Ensure contributions is an integer
-            try:
-                repo["contributions"] = int(repo.get("contributions", 0))
-            except (ValueError, TypeError):
-                repo["contributions"] = 0
-            
-            # Ensure stars is an integer
-            if "stars" not in repo:
-                repo["stars"] = 0
-            else:
-                try:
-                    repo["stars"] = int(repo["stars"])
-                except (ValueError, TypeError):
-                    repo["stars"] = 0
-        
         # Sort the repositories
         reverse_sort = sort_order.lower() == "desc"
+        sort_key = {
+            "contributions": lambda x: x.get("contributions", 0),
+            "name": lambda x: x.get("repository", ""),
+            "stars": lambda x: x.get("stars", 0)
+        }.get(sort_by)
         
-        if sort_by == "contributions":
-            contributor_repos.sort(
-                key=lambda x: x.get("contributions", 0), 
-                reverse=reverse_sort
-            )
-        elif sort_by == "name":
-            contributor_repos.sort(
-                key=lambda x: x.get("repository", ""), 
-                reverse=reverse_sort
-            )
-        elif sort_by == "stars":
-            contributor_repos.sort(
-                key=lambda x: x.get("stars", 0), 
-                reverse=reverse_sort
-            )
+        # Calculate pagination
+        total = len(contributor_repos)
+        total_pages = (total + page_size - 1) // page_size if total > 0 else 0
+        start_idx = (page - 1) * page_size
+        end_idx = start_idx + page_size
+        
+        # Get the current page of results without sorting past it
+        page_results = _sorted_page(contributor_repos, sort_key, reverse_sort, start_idx, end_idx)
         
-        # Add repository details if not already present
+        # Add repository details (only the returned page needs them) if not already present
         try:
-            repos_data = read_csv_file(get_latest_data_files()["repositories"])
-            repos_by_name = {repo.get("full_name"): repo for repo in repos_data}
+            repos_by_name = get_repositories_by_name(files, "repositories")
             
-            for repo in contributor_repos:
+            for repo in page_results:
                 repo_name = repo.get("repository")
                 if repo_name in repos_by_name:
                     repo_details = repos_by_name[repo_name]
                     
                     # Only set these fields if they're not already set
                     if "stars" not in repo or repo["stars"] == 0:
-                        repo["stars"] = int(repo_details.get("stargazers_count", 0))
+                        repo["stars"] = repo_details.get("stargazers_count", 0)
                     
                     if "forks" not in repo:
-                        repo["forks"] = int(repo_details.get("forks_count", 0))
+                        repo["forks"] = repo_details.get("forks_count", 0)
                     
                     if "language" not in repo or not repo["language"]:
                         repo["language"] = repo_details.get("language", "")
@@ -892,15 +1339,6 @@ async def get_contributor_details(
         except Exception as e:
             logging.error(f"Error adding repository details: {e}")
         
-        # Calculate pagination
-        total = len(contributor_repos)
-        total_pages = (total + page_size - 1) // page_size if total > 0 else 0
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        
-        # Get the current page of results
-        page_results = contributor_repos[start_idx:end_idx]
-        
         # Calculate total contributions
         total_contributions = 0
         try:
@@ -915,7 +1353,7 @@ async def get_contributor_details(
         
         contributor_profile["total_contributions"] = total_contributions
         
-        return {
+        return JSONResponse(content={
             "profile": contributor_profile,
             "repositories": {
                 "items": page_results,
@@ -924,7 +1362,7 @@ async def get_contributor_details(
                 "page_size": page_size,
                 "total_pages": total_pages
             }
-        }
+        })
         
     except HTTPException:
         raise
@@ -933,7 +1371,7 @@ async def get_contributor_details(
         raise HTTPException(status_code=500, detail=f"Error fetching contributor details: {str(e)}")
 
 @app.get("/api/repositories/{repo_name}/contributors", response_model=Dict[str, Any])
-async def get_repository_contributors(
+def get_repository_contributors(
     repo_name: str,
     page: int = Query(1, description="Page number"),
     page_size: int = Query(20, description="Number of results per page"),
@@ -942,89 +1380,51 @@ async def get_repository_contributors(
 ):
     """Get contributors for a specific repository."""
     try:
-        contributors_data = read_csv_file(get_latest_data_files()["contributors"])
-        
-        # Filter contributors for this repository
-        repo_contributors = []
+        files = get_latest_data_files()
+        by_direct_repo, by_json_repo = get_cached_result(
+            "contributors_by_repository",
+            (files["contributors"],),
+            lambda: _index_contributors_by_repository(read_csv_file(files["contributors"]))
+        )
         
         # First check for direct repository matches
-        for contributor in contributors_data:
-            if contributor.get("repository") == repo_name:
-                repo_contributors.append(contributor)
+        repo_contributors = [dict(contributor) for contributor in by_direct_repo.get(repo_name, ())]
         
         # If no direct matches, check repository_contributions field
         if not repo_contributors:
-            for contributor in contributors_data:
-                repo_contributions = contributor.get("repository_contributions")
-                if repo_contributions:
-                    try:
-                        # Try to parse as JSON
-                        if isinstance(repo_contributions, str):
-                            repo_data_list = json.loads(repo_contributions)
-                            
-                            if isinstance(repo_data_list, list):
-                                for repo_data in repo_data_list:
-                                    if isinstance(repo_data, dict) and repo_data.get("repository") == repo_name:
-                                        # Create a new contributor entry for this repository
-                                        contributor_entry = {k: v for k, v in contributor.items() 
-                                                           if k != "repository" and k != "contributions" and k != "repository_contributions"}
-                                        
-                                        # Add repository-specific fields
-                                        contributor_entry["repository"] = repo_name
-                                        contributor_entry["contributions"] = repo_data.get("contributions", 0)
-                                        
-                                        repo_contributors.append(contributor_entry)
-                    except json.JSONDecodeError:
-                        pass
-                    except Exception as e:
-                        logging.error(f"Error parsing repository_contributions: {e}")
-        
-        # Ensure numeric fields
-        for contributor in repo_contributors:
-            # Ensure contributions is an integer
-            try:
-                contributor["contributions"] = int(contributor.get("contributions", 0))
-            except (ValueError, TypeError):
-                contributor["contributions"] = 0
+            for contributor, repo_data in by_json_repo.get(repo_name, ()):
+                # Create a new contributor entry for this repository
+                contributor_entry = {k: v for k, v in contributor.items() 
+                                   if k != "repository" and k != "contributions" and k != "repository_contributions"}
                 
-            # Ensure followers is an integer
-            try:
-                contributor["followers"] = int(contributor.get("followers", 0))
-            except (ValueError, TypeError):
-                contributor["followers"] = 0
+                # Add repository-specific fields
+                contributor_entry["repository"] = repo_name
+                contributor_entry["contributions"] = _parse_int(repo_data.get("contributions", 0))
+                
+                repo_contributors.append(contributor_entry)
+        
+        # Numeric columns are already ints from load time; only default the ones a row lacks
+        for contributor in repo_contributors:
+            contributor.setdefault("contributions", 0)
+            contributor.setdefault("followers", 0)
         
         # Sort the results
         reverse_sort = sort_order.lower() == "desc"
-        
-        if sort_by == "contributions":
-            repo_contributors.sort(
-                key=lambda x: x.get("contributions", 0), 
-                reverse=reverse_sort
-            )
-        elif sort_by == "followers":
-            repo_contributors.sort(
-                key=lambda x: x.get("followers", 0), 
-                reverse=reverse_sort
-            )
+        sort_key = {
+            "contributions": lambda x: x.get("contributions", 0),
+            "followers": lambda x: x.get("followers", 0)
+        }.get(sort_by)
         
         # Get repository details
         repo_details = None
         try:
-            repos_data = read_csv_file(get_latest_data_files()["repositories_detailed"])
-            for repo in repos_data:
-                if repo.get("full_name") == repo_name:
-                    repo_details = repo
-                    break
+            repo_details = get_repositories_by_name(files, "repositories_detailed").get(repo_name)
         except Exception as e:
             logging.error(f"Error reading detailed repositories: {e}")
             
         if not repo_details:
             try:
-                repos_data = read_csv_file(get_latest_data_files()["repositories"])
-                for repo in repos_data:
-                    if repo.get("full_name") == repo_name:
-                        repo_details = repo
-                        break
+                repo_details = get_repositories_by_name(files, "repositories").get(repo_name)
             except Exception as e:
                 logging.error(f"Error reading repositories: {e}")
         
@@ -1034,10 +1434,10 @@ async def get_repository_contributors(
         start_idx = (page - 1) * page_size
         end_idx = start_idx + page_size
         
-        # Get the current page of results
-        page_results = repo_contributors[start_idx:end_idx]
+        # Get the current page of results without sorting past it
+        page_results = _sorted_page(repo_contributors, sort_key, reverse_sort, start_idx, end_idx)
         
-        return {
+        return JSONResponse(content={
             "repository": repo_details,
             "contributors": {
                 "items": page_results,
@@ -1046,18 +1446,19 @@ async def get_repository_contributors(
                 "page_size": page_size,
                 "total_pages": total_pages
             }
-        }
+        })
         
     except Exception as e:
         logging.exception(f"Error fetching contributors for repository {repo_name}")
         raise HTTPException(status_code=500, detail=f"Error fetching repository contributors: {str(e)}")
 
 @app.get("/api/debug/stats-extended", response_model=Dict[str, Any])
-async def debug_extended_stats():
+def debug_extended_stats():
     """Debug endpoint for extended stats."""
     try:
-        repositories = read_csv_file(get_latest_data_files()["repositories_detailed"])
-        contributors = read_csv_file(get_latest_data_files()["contributors"])
+        files = get_latest_data_files()
+        repositories = read_csv_file(files["repositories_detailed"])
+        contributors = read_csv_file(files["contributors"])
         
         # Get sample data
         repo_sample = repositories[:5] if repositories else []
@@ -1096,13 +1497,225 @@ async def debug_extended_stats():
         logging.exception("Error in debug extended stats endpoint")
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
 
-@app.api_route("/api/health", methods=["GET", "HEAD"])
+@app.get("/api/health")
 async def health_check():
     """Health check endpoint to verify API is running"""
-    return {"status": "ok", "timestamp": datetime.now().isoformat()}
+    return Response(content=HEALTH_RESPONSE_BODY, media_type="application/json")
+
+@app.head("/api/health")
+async def health_check_head():
+    """Liveness probe: an empty 200 response."""
+    return Response()
+
+def _candidates_page(
+    signature: Tuple[Tuple[int, int], ...],
+    contributors_file: Path,
+    repositories_file: Path,
+    page: int,
+    page_size: int,
+    sort_by: str,
+    sort_order: str,
+    location: Optional[str],
+    language: Optional[str],
+    min_followers: Optional[int],
+    min_contributions: Optional[int]
+) -> Dict[str, Any]:
+    """
+    Get one page of /api/candidates, memoized per query for the current data files.
+    
+    Repeated queries (e.g. the default first page) are served without
+    recomputing. Only the latest data files' pages are kept, pages larger than
+    CANDIDATES_PAGE_CACHE_MAX_PAGE_SIZE aren't cached, and neither are pages
+    built from a fallback after an error, so a transient failure only affects
+    that one request.
+    """
+    global _CANDIDATES_PAGE_SOURCE
+    
+    source = (contributors_file, repositories_file, signature)
+    key = (page, page_size, sort_by, sort_order, location, language, min_followers, min_contributions)
+    cacheable = page_size <= CANDIDATES_PAGE_CACHE_MAX_PAGE_SIZE
+    
+    if cacheable:
+        with _CANDIDATES_PAGE_LOCK:
+            if _CANDIDATES_PAGE_SOURCE == source and key in _CANDIDATES_PAGE_CACHE:
+                _CANDIDATES_PAGE_CACHE.move_to_end(key)
+                return _CANDIDATES_PAGE_CACHE[key]
+    
+    result, complete = _build_candidates_page(
+        contributors_file, repositories_file, page, page_size, sort_by, sort_order,
+        location, language, min_followers, min_contributions
+    )
+    
+    if cacheable and complete:
+        with _CANDIDATES_PAGE_LOCK:
+            if _CANDIDATES_PAGE_SOURCE != source:
+                # The data files changed, so the cached pages are out of date
+                _CANDIDATES_PAGE_CACHE.clear()
+                _CANDIDATES_PAGE_SOURCE = source
+            _CANDIDATES_PAGE_CACHE[key] = result
+            if len(_CANDIDATES_PAGE_CACHE) > CANDIDATES_PAGE_CACHE_SIZE:
+                _CANDIDATES_PAGE_CACHE.popitem(last=False)
+    return result
+
+def _build_candidates_page(
+    contributors_file: Path,
+    repositories_file: Path,
+    page: int,
+    page_size: int,
+    sort_by: str,
+    sort_order: str,
+    location: Optional[str],
+    language: Optional[str],
+    min_followers: Optional[int],
+    min_contributions: Optional[int]
+) -> Tuple[Dict[str, Any], bool]:
+    """
+    Build one page of /api/candidates.
+    
+    Returns the page and whether it is complete (False when the repositories
+    file couldn't be read and a fallback was used instead).
+    """
+    files = {"contributors": contributors_file, "repositories_detailed": repositories_file}
+    contributors_data = read_csv_file(files["contributors"])
+    
+    # Normalize the filter values once instead of once per row (the location
+    # substring match is casefolded so it is caseless for non-ASCII text too)
+    location_folded = location.casefold() if location else None
+    language_lower = language.lower() if language else None
+    
+    # Casefolded locations and lowercased repository languages are cached per data
+    # version, so the filters don't normalize (or join) every row on each request
+    locations_folded = None
+    if location:
+        locations_folded = get_cached_result(
+            "candidate_locations_casefolded",
+            (files["contributors"],),
+            lambda: _casefold_locations(contributors_data)
+        )
+    
+    languages_lower = None
+    if language:
+        # We need to join with repositories to get language info
+        try:
+            languages_lower = get_cached_result(
+                "candidate_languages_lower",
+                (files["contributors"], files["repositories_detailed"]),
+                lambda: _lowercase_repository_languages(
+                    contributors_data, get_repositories_by_name(files, "repositories_detailed")
+                )
+            )
+        except Exception as e:
+            logging.error(f"Error filtering by language: {e}")
+            # If we can't load the repositories file, skip language filtering
+            return {"items": [], "total": 0, "page": page, "page_size": page_size, "total_pages": 0}, False
+    
+    # The numeric filters scan packed int columns rather than reading each row dict
+    followers_column = None
+    if min_followers is not None:
+        followers_column = get_cached_result(
+            "candidate_followers_column",
+            (files["contributors"],),
+            lambda: _int_column(contributors_data, "followers")
+        )
+    
+    contributions_column = None
+    if min_contributions is not None:
+        contributions_column = get_cached_result(
+            "candidate_total_contributions_column",
+            (files["contributors"],),
+            lambda: _int_column(contributors_data, "total_contributions")
+        )
+    
+    def matches_filters(i: int) -> bool:
+        if location_folded and location_folded not in locations_folded[i]:
+            return False
+        if language_lower and languages_lower[i] != language_lower:
+            return False
+        if min_followers is not None and not (followers_column[i] and followers_column[i] >= min_followers):
+            return False
+        if min_contributions is not None and not (
+                contributions_column[i] and contributions_column[i] >= min_contributions):
+            return False
+        return True
+    
+    reverse_sort = sort_order.lower() == "desc"
+    # Sort key still to apply when paginating (None once the matches are already in order)
+    sort_key = None
+    
+    if sort_by in CANDIDATE_SORT_KEYS:
+        # Walk the rows in their precomputed sort order, so the matches come out already sorted
+        sort_orders = get_cached_result(
+            "candidate_sort_orders",
+            (files["contributors"],),
+            lambda: _sort_orders(contributors_data, CANDIDATE_SORT_KEYS)
+        )
+        filtered_contributors = [
+            contributors_data[i] for i in sort_orders[(sort_by, reverse_sort)] if matches_filters(i)
+        ]
+    else:
+        # Apply all filters in one pass over the shared rows; only the returned page is copied below
+        filtered_contributors = [
+            contributors_data[i] for i in range(len(contributors_data)) if matches_filters(i)
+        ]
+        
+        if sort_by == "repositories":
+            # Count repositories per contributor
+            contributor_repos = defaultdict(set)
+            for c in filtered_contributors:
+                contributor_repos[c.get("username")].add(c.get("repository"))
+            repo_counts = {username: len(repos) for username, repos in contributor_repos.items()}
+            
+            sort_key = lambda x: repo_counts[x.get("username")]
+    
+    # Calculate pagination
+    total = len(filtered_contributors)
+    total_pages = (total + page_size - 1) // page_size
+    start_idx = (page - 1) * page_size
+    end_idx = start_idx + page_size
+    
+    # Get the current page of results (without sorting past it), copied so they can be annotated
+    page_results = [
+        dict(c) for c in _sorted_page(filtered_contributors, sort_key, reverse_sort, start_idx, end_idx)
+    ]
+    
+    # Process each contributor on the page
+    for contributor in page_results:
+        # Decoded once per distinct value by the memoized parser, not per request
+        contributor["repository_contributions_parsed"] = list(
+            _parse_repository_contributions(contributor.get("repository_contributions"))
+        )
+        
+        # Numeric columns are already ints from load time; only default the ones a row lacks
+        contributor.setdefault("total_contributions", 0)
+        contributor.setdefault("followers", 0)
+        contributor.setdefault("public_repos", 0)
+    
+    # Enhance with repository stars
+    complete = True
+    try:
+        repos_by_name = get_repositories_by_name(files, "repositories_detailed")
+        
+        # Star counts are already ints from load time, so this is a plain lookup per page row
+        for contributor in page_results:
+            repo = repos_by_name.get(contributor.get("repository"))
+            contributor["repository_stars"] = repo.get("stargazers_count", 0) if repo is not None else 0
+    except Exception as e:
+        logging.error(f"Error enhancing with repository stars: {e}")
+        # If we can't load the repositories file, set stars to 0
+        for contributor in page_results:
+            contributor["repository_stars"] = 0
+        complete = False
+    
+    return {
+        "items": page_results,
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": total_pages
+    }, complete
 
 @app.get("/api/candidates", response_model=Dict[str, Any])
-async def get_candidates(
+def get_candidates(
     page: int = Query(1, description="Page number"),
     page_size: int = Query(20, description="Number of results per page"),
     sort_by: str = Query("total_contributions", description="Field to sort by"),
@@ -1114,202 +1727,50 @@ async def get_candidates(
 ):
     """Get a list of candidates (contributors) with pagination and filtering."""
     try:
-        contributors_data = read_csv_file(get_latest_data_files()["contributors"])
-        
-        # Process each contributor
-        for contributor in contributors_data:
-            # Parse repository_contributions if it's a string
-            if "repository_contributions" in contributor and isinstance(contributor["repository_contributions"], str):
-                try:
-                    # If it's a JSON string, parse it
-                    if contributor["repository_contributions"].startswith("[") and contributor["repository_contributions"].endswith("]"):
-                        contributor["repository_contributions_parsed"] = json.loads(contributor["repository_contributions"])
-                    else:
-                        contributor["repository_contributions_parsed"] = []
-                except json.JSONDecodeError:
-                    contributor["repository_contributions_parsed"] = []
-            else:
-                contributor["repository_contributions_parsed"] = []
-            
-            # Ensure contributions is an integer
-            try:
-                contributor["total_contributions"] = int(contributor.get("total_contributions", 0))
-            except (ValueError, TypeError):
-                contributor["total_contributions"] = 0
-                
-            # Ensure followers is an integer
-            try:
-                contributor["followers"] = int(contributor.get("followers", 0))
-            except (ValueError, TypeError):
-                contributor["followers"] = 0
-                
-            # Ensure public_repos is an integer
-            try:
-                contributor["public_repos"] = int(contributor.get("public_repos", 0))
-            except (ValueError, TypeError):
-                contributor["public_repos"] = 0
-        
-        # Apply filters
-        filtered_contributors = contributors_data
-        
-        if location:
-            filtered_contributors = [
-                c for c in filtered_contributors 
-                if c.get("location") and location.lower() in c.get("location", "").lower()
-            ]
-            
-        if language:
-            # We need to join with repositories to get language info
-            try:
-                repos_data = read_csv_file(get_latest_data_files()["repositories_detailed"])
-                repos_by_name = {repo.get("full_name"): repo for repo in repos_data}
-                
-                filtered_contributors = [
-                    c for c in filtered_contributors
-                    if c.get("repository") in repos_by_name and 
-                    repos_by_name[c.get("repository")].get("language", "").lower() == language.lower()
-                ]
-            except Exception as e:
-                logging.error(f"Error filtering by language: {e}")
-                # If we can't load the repositories file, skip language filtering
-                if language:
-                    return {"items": [], "total": 0, "page": page, "page_size": page_size, "total_pages": 0}
-            
-        if min_followers is not None:
-            filtered_contributors = [
-                c for c in filtered_contributors
-                if c.get("followers") and int(c.get("followers", 0)) >= min_followers
-            ]
-            
-        if min_contributions is not None:
-            filtered_contributors = [
-                c for c in filtered_contributors
-                if c.get("total_contributions") and int(c.get("total_contributions", 0)) >= min_contributions
-            ]
-        
-        # Sort the results
-        reverse_sort = sort_order.lower() == "desc"
-        
-        if sort_by == "total_contributions":
-            filtered_contributors.sort(
-                key=lambda x: x.get("total_contributions", 0), 
-                reverse=reverse_sort
-            )
-        elif sort_by == "followers":
-            filtered_contributors.sort(
-                key=lambda x: x.get("followers", 0), 
-                reverse=reverse_sort
-            )
-        elif sort_by == "repositories":
-            # Count repositories per contributor
-            contributor_repos = {}
-            for c in filtered_contributors:
-                username = c.get("username")
-                if username not in contributor_repos:
-                    contributor_repos[username] = set()
-                contributor_repos[username].add(c.get("repository"))
-            
-            filtered_contributors.sort(
-                key=lambda x: len(contributor_repos.get(x.get("username"), set())), 
-                reverse=reverse_sort
-            )
-        
-        # Calculate pagination
-        total = len(filtered_contributors)
-        total_pages = (total + page_size - 1) // page_size
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        
-        # Get the current page of results
-        page_results = filtered_contributors[start_idx:end_idx]
-        
-        # Enhance with repository stars
-        try:
-            repos_data = read_csv_file(get_latest_data_files()["repositories_detailed"])
-            repos_by_name = {repo.get("full_name"): repo for repo in repos_data}
-            
-            for contributor in page_results:
-                repo_name = contributor.get("repository")
-                if repo_name in repos_by_name:
-                    try:
-                        contributor["repository_stars"] = int(repos_by_name[repo_name].get("stargazers_count", 0))
-                    except (ValueError, TypeError):
-                        contributor["repository_stars"] = 0
-                else:
-                    contributor["repository_stars"] = 0
-        except Exception as e:
-            logging.error(f"Error enhancing with repository stars: {e}")
-            # If we can't load the repositories file, set stars to 0
-            for contributor in page_results:
-                contributor["repository_stars"] = 0
-        
-        return {
-            "items": page_results,
-            "total": total,
-            "page": page,
-            "page_size": page_size,
-            "total_pages": total_pages
-        }
+        files = get_latest_data_files()
+        return JSONResponse(content=_candidates_page(
+            get_files_signature(files["contributors"], files["repositories_detailed"]),
+            files["contributors"],
+            files["repositories_detailed"],
+            page,
+            page_size,
+            sort_by,
+            sort_order,
+            location,
+            language,
+            min_followers,
+            min_contributions
+        ))
         
     except Exception as e:
         logging.exception("Error fetching candidates")
         raise HTTPException(status_code=500, detail=f"Error fetching candidates: {str(e)}")
 
 @app.get("/api/candidates/languages", response_model=List[Dict[str, Any]])
-async def get_candidate_languages():
+def get_candidate_languages():
     """Get programming languages used by candidates for filtering."""
     try:
-        repos_data = read_csv_file(get_latest_data_files()["repositories_detailed"])
-        
-        # Count languages
-        languages = {}
-        for repo in repos_data:
-            lang = repo.get("language")
-            if lang and lang.lower() not in ["null", "none", ""]:
-                if lang not in languages:
-                    languages[lang] = 0
-                languages[lang] += 1
-        
-        # Convert to list of objects
-        language_list = [
-            {"name": lang, "count": count}
-            for lang, count in languages.items()
-        ]
-        
-        # Sort by count (descending)
-        language_list.sort(key=lambda x: x["count"], reverse=True)
-        
-        return language_list
+        files = get_latest_data_files()
+        return JSONResponse(content=get_cached_result(
+            "candidate_languages",
+            (files["repositories_detailed"],),
+            lambda: _count_candidate_languages(read_csv_file(files["repositories_detailed"]))
+        ))
         
     except Exception as e:
         logging.exception("Error fetching candidate languages")
         raise HTTPException(status_code=500, detail=f"Error fetching candidate languages: {str(e)}")
 
 @app.get("/api/candidates/locations", response_model=List[Dict[str, Any]])
-async def get_candidate_locations():
+def get_candidate_locations():
     """Get locations of candidates for filtering."""
     try:
-        contributors_data = read_csv_file(get_latest_data_files()["contributors"])
-        
-        # Count locations
-        locations = {}
-        for contributor in contributors_data:
-            location = contributor.get("location")
-            if location and location.lower() not in ["null", "none", ""]:
-                if location not in locations:
-                    locations[location] = 0
-                locations[location] += 1
-        
-        # Convert to list of objects
-        location_list = [
-            {"name": loc, "count": count}
-            for loc, count in locations.items()
-        ]
-        
-        # Sort by count (descending)
-        location_list.sort(key=lambda x: x["count"], reverse=True)
-        
-        return location_list
+        files = get_latest_data_files()
+        return JSONResponse(content=get_cached_result(
+            "candidate_locations",
+            (files["contributors"],),
+            lambda: _count_candidate_locations(read_csv_file(files["contributors"]))
+        ))
         
     except Exception as e:
         logging.exception("Error fetching candidate locations")
@@ -2,8 +2,16 @@ import os
 import csv
 import time
 import json
+import queue
+import random
+import shelve
+import threading
 import requests
-from typing import List, Dict, Any, Optional
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from requests.adapters import HTTPAdapter
+from typing import List, Dict, Any, Optional, Set, Tuple, Iterator, TypeVar
 from dotenv import load_dotenv
 from datetime import datetime
 from pathlib import Path
@@ -21,34 +29,96 @@ HEADERS = {
     "Accept": "application/vnd.github.v3+json"
 }
 
+# Repository search endpoint (the query itself is passed as URL-encoded params)
+SEARCH_REPOSITORIES_URL = "https://api.github.com/search/repositories"
+SEARCH_RESULT_CAP = 1000  # the Search API returns at most this many results per query
+
+# Fields kept from each search result, in CSV column order ("license" is reduced to its
+# name and "topics" defaults to an empty list; "matched_keyword" is appended after them)
+SEARCH_REPOSITORY_FIELDS = (
+    "id", "name", "full_name", "html_url", "description", "created_at", "updated_at",
+    "pushed_at", "homepage", "size", "stargazers_count", "watchers_count", "language",
+    "forks_count", "open_issues_count", "license", "topics", "has_wiki", "has_pages",
+    "has_projects", "has_downloads", "archived", "disabled", "visibility", "default_branch"
+)
+
 # Rate limiting parameters
 MAX_RETRIES = 3
-RETRY_DELAY = 10  # seconds
+MAX_BACKOFF = 60  # seconds, cap for exponential backoff between retries
+SECONDARY_RATE_LIMIT_DELAY = 60  # seconds, GitHub's minimum wait for secondary rate limits
+REQUEST_TIMEOUT = 30  # seconds
+RATE_LIMIT_LOW_WATER = 100  # below this many remaining calls, spread them over the reset window
+
+# On-disk cache of ETag-tagged API responses, reused across runs via conditional requests
+ETAG_CACHE_PATH = Path("github_data_2") / "etag_cache"
+
+# Worker threads for fetching a repository's languages, contributors and user details concurrently
+MAX_WORKERS = 10
+
+# Most repositories processed between rewrites of the contributors snapshot
+CONTRIBUTOR_SAVE_MAX_INTERVAL = 100
+
+# How many search results may be buffered ahead of the repository processing loop
+SEARCH_PREFETCH_SIZE = 256
+
+# Write buffer for CSV output, so large files are written in a few big chunks
+CSV_BUFFER_SIZE = 1 << 23  # 8 MB
+
+# Shared session so API calls reuse pooled keep-alive connections instead of
+# opening a new TCP+TLS connection for every request
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=0))
+
+# Latest (remaining, reset epoch) reported by GitHub for each rate limit resource
+# ("core", "search", ...), used to pace requests only when the budget runs low
+_RATE_STATE: Dict[str, Tuple[int, float]] = {}
+# Serializes pacing sleeps per resource so concurrent workers are spaced out rather than
+# sleeping in parallel (and search pacing doesn't hold up core API calls)
+_RATE_LOCKS: Dict[str, threading.Lock] = defaultdict(threading.Lock)
+
+# URL -> (ETag, JSON data) shelf, opened on first use; shelves aren't thread-safe, hence the lock
+_ETAG_CACHE: Optional[shelve.Shelf] = None
+_ETAG_LOCK = threading.Lock()
 
-def search_repositories(keywords: List[str], min_stars: int = 10, limit: int = 1000) -> List[Dict[str, Any]]:
+# URLs GitHub answered 404 Not Found for (e.g. deleted users), so they aren't requested again;
+# other failures are transient and may succeed on a later request
+_NOT_FOUND_URLS: Set[str] = set()
+
+def search_repositories(keywords: List[str], min_stars: int = 10, limit: int = 1000) -> Iterator[Dict[str, Any]]:
     """
     Search GitHub repositories based on keywords.
     
+    Repositories are yielded as each page of results is parsed, so callers can
+    start processing them while the search continues.
+    
     Args:
         keywords: List of keywords to search for
         min_stars: Minimum number of stars for repositories
         limit: Maximum number of repositories to return
         
-    Returns:
-        List of repository data dictionaries
+    Yields:
+        Repository data dictionaries, without duplicates across keywords
     """
-    all_repos = []
+    found = 0
+    seen_ids = set()  # IDs already yielded, for O(1) dedup across keywords
     
     for keyword in keywords:
         print(f"Searching repositories with keyword: {keyword}")
         page = 1
         per_page = 100  # GitHub API maximum
         
-        while len(all_repos) < limit:
-            query = f"{keyword} in:description stars:>={min_stars}"
-            url = f"https://api.github.com/search/repositories?q={query}&sort=stars&order=desc&page={page}&per_page={per_page}"
+        while found < limit:
+            # Let requests URL-encode the query (keywords contain spaces, the star filter ">=")
+            params = {
+                "q": f"{keyword} in:description stars:>={min_stars}",
+                "sort": "stars",
+                "order": "desc",
+                "page": page,
+                "per_page": per_page
+            }
             
-            response = make_github_request(url)
+            response = make_github_request(SEARCH_REPOSITORIES_URL, params=params)
             if not response:
                 break
                 
@@ -58,51 +128,64 @@ def search_repositories(keywords: List[str], min_stars: int = 10, limit: int = 1
                 
             # Extract relevant information from each repository
             for repo in repos:
-                repo_data = {
-                    "id": repo.get("id"),
-                    "name": repo.get("name"),
-                    "full_name": repo.get("full_name"),
-                    "html_url": repo.get("html_url"),
-                    "description": repo.get("description"),
-                    "created_at": repo.get("created_at"),
-                    "updated_at": repo.get("updated_at"),
-                    "pushed_at": repo.get("pushed_at"),
-                    "homepage": repo.get("homepage"),
-                    "size": repo.get("size"),
-                    "stargazers_count": repo.get("stargazers_count"),
-                    "watchers_count": repo.get("watchers_count"),
-                    "language": repo.get("language"),
-                    "forks_count": repo.get("forks_count"),
-                    "open_issues_count": repo.get("open_issues_count"),
-                    "license": (repo.get("license") or {}).get("name"),
-                    "topics": repo.get("topics", []),
-                    "has_wiki": repo.get("has_wiki"),
-                    "has_pages": repo.get("has_pages"),
-                    "has_projects": repo.get("has_projects"),
-                    "has_downloads": repo.get("has_downloads"),
-                    "archived": repo.get("archived"),
-                    "disabled": repo.get("disabled"),
-                    "visibility": repo.get("visibility"),
-                    "default_branch": repo.get("default_branch"),
-                    "matched_keyword": keyword
-                }
+                repo_data = dict(zip(SEARCH_REPOSITORY_FIELDS, map(repo.get, SEARCH_REPOSITORY_FIELDS)))
+                repo_data["license"] = (repo_data["license"] or {}).get("name")
+                repo_data["topics"] = repo.get("topics", [])
+                repo_data["matched_keyword"] = keyword
                 
-                # Check if repo is already in the list (from another keyword)
-                if not any(r["id"] == repo_data["id"] for r in all_repos):
-                    all_repos.append(repo_data)
+                # Check if repo was already found (from another keyword)
+                if repo_data["id"] not in seen_ids:
+                    seen_ids.add(repo_data["id"])
+                    found += 1
+                    yield repo_data
                     
-                if len(all_repos) >= limit:
+                if found >= limit:
                     break
             
-            # Check if we've reached the last page
+            # Check if we've reached the last page, either of the results or of what
+            # the Search API will return at all (it stops after SEARCH_RESULT_CAP results)
             if len(repos) < per_page:
                 break
+            if page * per_page >= min(response.get("total_count", SEARCH_RESULT_CAP), SEARCH_RESULT_CAP):
+                break
                 
             page += 1
-            time.sleep(1)  # Be nice to the API
     
-    print(f"Found {len(all_repos)} unique repositories")
-    return all_repos
+    print(f"Found {found} unique repositories")
+
+T = TypeVar("T")
+
+def _prefetch(items: Iterator[T], maxsize: int = SEARCH_PREFETCH_SIZE) -> Iterator[T]:
+    """
+    Consume an iterator in a background thread, buffering up to maxsize items ahead.
+    
+    Lets a slow producer (e.g. paginated search) keep working while the caller
+    processes the items it has already produced. Exceptions raised by the
+    producer are re-raised to the caller once the buffered items are consumed.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=maxsize)
+    done = object()
+    errors = []
+    
+    def produce() -> None:
+        try:
+            for item in items:
+                buffer.put(item)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            buffer.put(done)
+    
+    threading.Thread(target=produce, daemon=True).start()
+    
+    while True:
+        item = buffer.get()
+        if item is done:
+            break
+        yield item
+    
+    if errors:
+        raise errors[0]
 
 def get_repository_details(repo_full_name: str) -> Optional[Dict[str, Any]]:
     """
@@ -115,7 +198,7 @@ def get_repository_details(repo_full_name: str) -> Optional[Dict[str, Any]]:
         Dictionary with repository details or None if request fails
     """
     url = f"https://api.github.com/repos/{repo_full_name}"
-    return make_github_request(url)
+    return make_github_request(url, conditional=True)
 
 def get_repository_languages(repo_full_name: str) -> Dict[str, int]:
     """
@@ -128,7 +211,7 @@ def get_repository_languages(repo_full_name: str) -> Dict[str, int]:
         Dictionary mapping language names to byte counts
     """
     url = f"https://api.github.com/repos/{repo_full_name}/languages"
-    response = make_github_request(url)
+    response = make_github_request(url, conditional=True)
     return response or {}
 
 def get_repository_contributors(repo_full_name: str, limit: int = 100) -> List[Dict[str, Any]]:
@@ -148,7 +231,7 @@ def get_repository_contributors(repo_full_name: str, limit: int = 100) -> List[D
     
     while len(contributors) < limit:
         url = f"https://api.github.com/repos/{repo_full_name}/contributors?page={page}&per_page={per_page}"
-        response = make_github_request(url)
+        response = make_github_request(url, conditional=True)
         
         if not response or not isinstance(response, list):
             break
@@ -162,7 +245,6 @@ def get_repository_contributors(repo_full_name: str, limit: int = 100) -> List[D
             break
             
         page += 1
-        time.sleep(1)  # Be nice to the API
     
     # Limit the number of contributors
     return contributors[:limit]
@@ -171,6 +253,9 @@ def get_user_details(username: str) -> Optional[Dict[str, Any]]:
     """
     Get detailed information about a GitHub user.
     
+    Users GitHub reported as not found are not requested again during the run;
+    other failed lookups are retried the next time the user comes up.
+    
     Args:
         username: GitHub username
         
@@ -178,45 +263,154 @@ def get_user_details(username: str) -> Optional[Dict[str, Any]]:
         Dictionary with user details or None if request fails
     """
     url = f"https://api.github.com/users/{username}"
-    return make_github_request(url)
+    if url in _NOT_FOUND_URLS:
+        return None
+    return make_github_request(url, conditional=True)
+
+def _rate_limit_resource(url: str) -> str:
+    """Name of the GitHub rate limit resource a request to this URL counts against."""
+    return "search" if "/search/" in url else "core"
+
+def _throttle(resource: str) -> None:
+    """Sleep just long enough to spread the remaining calls for a resource over its reset window."""
+    state = _RATE_STATE.get(resource)
+    if not state:
+        return
+    
+    remaining, reset_time = state
+    if remaining >= RATE_LIMIT_LOW_WATER:
+        return
+    
+    with _RATE_LOCKS[resource]:
+        sleep_time = (reset_time - time.time()) / max(remaining, 1)
+        if sleep_time > 0:
+            time.sleep(sleep_time)
+
+def _record_rate_limit(response: requests.Response) -> None:
+    """Remember the rate limit budget reported in a response's headers."""
+    headers = response.headers
+    if "X-RateLimit-Remaining" in headers and "X-RateLimit-Reset" in headers:
+        resource = headers.get("X-RateLimit-Resource", "core")
+        _RATE_STATE[resource] = (int(headers["X-RateLimit-Remaining"]), float(headers["X-RateLimit-Reset"]))
+
+def _backoff_delay(attempt: int, base: float = 2) -> float:
+    """Exponential backoff (capped at MAX_BACKOFF) with up to a second of random jitter."""
+    return min(MAX_BACKOFF, base * 2 ** attempt) + random.uniform(0, 1)
+
+def _get_etag_cache() -> shelve.Shelf:
+    """Open the ETag response cache on first use (callers must hold _ETAG_LOCK)."""
+    global _ETAG_CACHE
+    if _ETAG_CACHE is None:
+        ETAG_CACHE_PATH.parent.mkdir(exist_ok=True)
+        _ETAG_CACHE = shelve.open(str(ETAG_CACHE_PATH))
+    return _ETAG_CACHE
 
-def make_github_request(url: str) -> Optional[Any]:
+def close_etag_cache() -> None:
+    """Flush and close the ETag response cache if it was opened."""
+    global _ETAG_CACHE
+    with _ETAG_LOCK:
+        if _ETAG_CACHE is not None:
+            _ETAG_CACHE.close()
+            _ETAG_CACHE = None
+
+def make_github_request(url: str, conditional: bool = False,
+                        params: Optional[Dict[str, Any]] = None) -> Optional[Any]:
     """
     Make a request to the GitHub API with retry logic for rate limiting.
     
+    Requests are paced only when the remaining rate limit budget runs low,
+    rate limits are waited out using GitHub's Retry-After / X-RateLimit-Reset
+    headers, server errors and connection failures are retried with
+    exponential backoff and jitter, and other client errors fail immediately.
+    
+    Conditional requests send the ETag of the last response stored for the URL;
+    GitHub then answers 304 Not Modified (which doesn't count against the rate
+    limit) when nothing changed, and the stored data is returned.
+    
     Args:
         url: GitHub API URL
+        conditional: Whether to use and update the on-disk ETag cache for this URL
+        params: Query string parameters, URL-encoded by requests
         
     Returns:
         JSON response data or None if all retries fail
     """
+    resource = _rate_limit_resource(url)
+    
+    cached = None
+    headers = None
+    if conditional:
+        with _ETAG_LOCK:
+            cached = _get_etag_cache().get(url)
+        if cached:
+            headers = {"If-None-Match": cached[0]}
+    
     for attempt in range(MAX_RETRIES):
         try:
-            response = requests.get(url, headers=HEADERS)
+            _throttle(resource)
+            response = SESSION.get(url, params=params, headers=headers, timeout=REQUEST_TIMEOUT)
+            _record_rate_limit(response)
+            
+            if response.status_code == 304 and cached:
+                return cached[1]
+            
+            if response.status_code == 200:
+                data = response.json()
+                etag = response.headers.get("ETag")
+                if conditional and etag:
+                    with _ETAG_LOCK:
+                        _get_etag_cache()[url] = (etag, data)
+                return data
             
             # Check for rate limiting
-            if response.status_code == 403 and 'X-RateLimit-Remaining' in response.headers and int(response.headers['X-RateLimit-Remaining']) == 0:
-                reset_time = int(response.headers['X-RateLimit-Reset'])
-                sleep_time = max(reset_time - time.time(), 0) + 1
-                print(f"Rate limit exceeded. Sleeping for {sleep_time:.2f} seconds.")
-                time.sleep(sleep_time)
-                continue
+            if response.status_code in (403, 429):
+                retry_after = response.headers.get("Retry-After", "")
+                if retry_after.isdigit():
+                    sleep_time = int(retry_after) + 1
+                    print(f"Rate limited. Retrying after {sleep_time} seconds.")
+                    time.sleep(sleep_time)
+                    continue
                 
-            # Check for other errors
-            if response.status_code != 200:
-                print(f"Error: {response.status_code} - {response.text}")
-                time.sleep(RETRY_DELAY)
-                continue
+                if response.headers.get("X-RateLimit-Remaining") == "0":
+                    reset_time = int(response.headers["X-RateLimit-Reset"])
+                    sleep_time = max(reset_time - time.time(), 0) + 1
+                    print(f"Rate limit exceeded. Sleeping for {sleep_time:.2f} seconds.")
+                    time.sleep(sleep_time)
+                    continue
                 
-            return response.json()
+                if response.status_code == 429 or "rate limit" in response.text.lower():
+                    # Secondary rate limit without a Retry-After header: wait at least a minute
+                    sleep_time = _backoff_delay(attempt, SECONDARY_RATE_LIMIT_DELAY)
+                    print(f"Secondary rate limit hit. Sleeping for {sleep_time:.2f} seconds.")
+                    time.sleep(sleep_time)
+                    continue
+            
+            # Server errors are usually transient, so retry them with backoff
+            if response.status_code >= 500:
+                sleep_time = _backoff_delay(attempt)
+                print(f"Error: {response.status_code} - retrying in {sleep_time:.2f} seconds")
+                time.sleep(sleep_time)
+                continue
+            
+            # Other client errors (e.g. 404 for a deleted user) won't succeed on retry
+            if response.status_code == 404:
+                _NOT_FOUND_URLS.add(url)
+            print(f"Error: {response.status_code} - {response.text}")
+            return None
             
         except Exception as e:
-            print(f"Request error: {str(e)}")
-            time.sleep(RETRY_DELAY)
+            sleep_time = _backoff_delay(attempt)
+            print(f"Request error: {str(e)} - retrying in {sleep_time:.2f} seconds")
+            time.sleep(sleep_time)
     
     print(f"Failed to get data from {url} after {MAX_RETRIES} attempts")
     return None
 
+def _to_csv_row(item: Dict[str, Any], fieldnames: List[str]) -> List[Any]:
+    """Build a positional CSV row of the item's fields, converting lists and dictionaries to JSON strings."""
+    return [json.dumps(value) if isinstance(value, (list, dict)) else value
+            for value in map(item.get, fieldnames)]
+
 def save_to_csv(data: List[Dict[str, Any]], filename: str, fieldnames: Optional[List[str]] = None) -> None:
     """
     Save data to a CSV file.
@@ -234,20 +428,11 @@ def save_to_csv(data: List[Dict[str, Any]], filename: str, fieldnames: Optional[
     if not fieldnames:
         fieldnames = list(data[0].keys())
         
-    with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
+    with open(filename, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(fieldnames)
         
-        for item in data:
-            # Handle lists and dictionaries by converting to JSON strings
-            row = {}
-            for key, value in item.items():
-                if key in fieldnames:
-                    if isinstance(value, (list, dict)):
-                        row[key] = json.dumps(value)
-                    else:
-                        row[key] = value
-            writer.writerow(row)
+        writer.writerows(_to_csv_row(item, fieldnames) for item in data)
             
     print(f"Data saved to {filename}")
 
@@ -262,6 +447,14 @@ def process_repositories(keywords: List[str], min_stars: int = 10, repo_limit: i
         repo_limit: Maximum number of repositories to process
         contributor_limit: Maximum number of contributors per repository
     """
+    try:
+        _process_repositories(keywords, min_stars, repo_limit, contributor_limit)
+    finally:
+        # Close the ETag cache even when the run stops early, so its entries are written out
+        close_etag_cache()
+
+def _process_repositories(keywords: List[str], min_stars: int, repo_limit: int,
+                          contributor_limit: int) -> None:
     # Create output directory
     output_dir = Path("github_data_2")
     output_dir.mkdir(exist_ok=True)
@@ -269,92 +462,139 @@ def process_repositories(keywords: List[str], min_stars: int = 10, repo_limit: i
     # Generate timestamp for filenames
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
-    # Search repositories
-    repositories = search_repositories(keywords, min_stars, repo_limit)
+    # Search repositories in the background, processing them as they stream in rather than
+    # after the whole search
+    repositories = _prefetch(search_repositories(keywords, min_stars, repo_limit))
+    first_repo = next(repositories, None)
     
-    if not repositories:
+    if first_repo is None:
         print("No repositories found matching the criteria")
         return
-        
-    # Save repositories to CSV
-    repo_filename = output_dir / f"repositories_{timestamp}.csv"
-    save_to_csv(repositories, repo_filename)
     
     # Process each repository for additional details and contributors
     # Using a dict to track aggregated contributor data keyed by username
     all_contributors: Dict[str, Dict[str, Any]] = {} 
     
-    for i, repo in enumerate(repositories):
-        repo_full_name = repo["full_name"]
-        print(f"Processing repository {i+1}/{len(repositories)}: {repo_full_name}")
-        
-        # Get repository languages and add to repo data
-        languages = get_repository_languages(repo_full_name)
-        repo["languages"] = languages
-        
-        # Get contributors for the repository
-        contributors = get_repository_contributors(repo_full_name, contributor_limit)
-        print(f"Found {len(contributors)} contributors for {repo_full_name}")
+    # Repository rows are written as they arrive from the search, and detailed rows are
+    # appended as each repository is processed, instead of rewriting whole files
+    repo_filename = output_dir / f"repositories_{timestamp}.csv"
+    repo_fieldnames = list(first_repo.keys())
+    detailed_filename = output_dir / f"repositories_detailed_{timestamp}.csv"
+    detailed_fieldnames = repo_fieldnames + ["languages"]
+    
+    # Contributors are updated in place, so their file is still rewritten as a whole, but
+    # at doubling intervals (10, 20, 40, ... repositories apart) capped at
+    # CONTRIBUTOR_SAVE_MAX_INTERVAL, so the file never falls far behind the run
+    contributor_filename = output_dir / f"contributors_{timestamp}.csv"
+    contributor_save_interval = 10
+    next_contributor_save = contributor_save_interval
+    contributors_saved = False
+    
+    def save_contributors() -> None:
+        # Convert the contributors dict to a list for CSV export
+        all_contributors_list = list(all_contributors.values())
+        if all_contributors_list:
+            save_to_csv(all_contributors_list, contributor_filename)
+    
+    repo_count = 0
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor, \
+            open(repo_filename, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as repo_file, \
+            open(detailed_filename, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as detailed_file:
+        repo_writer = csv.writer(repo_file)
+        repo_writer.writerow(repo_fieldnames)
+        detailed_writer = csv.writer(detailed_file)
+        detailed_writer.writerow(detailed_fieldnames)
         
-        # Process each contributor
-        for contributor in contributors:
-            username = contributor.get("login")
-            if not username:
-                continue
+        for repo in chain([first_repo], repositories):
+            repo_count += 1
+            repo_writer.writerow(_to_csv_row(repo, repo_fieldnames))
             
-            # Prepare contribution details for the current repository
-            contribution_info = {
-                "repository": repo_full_name,
-                "contributions": contributor.get("contributions"),
-                "repository_stars": repo.get("stargazers_count"),
-                "repository_language": repo.get("language")
-            }
+            repo_full_name = repo["full_name"]
+            print(f"Processing repository {repo_count}: {repo_full_name}")
+            
+            # Get repository languages (in the background) and contributors for the repository
+            languages_future = executor.submit(get_repository_languages, repo_full_name)
+            contributors = get_repository_contributors(repo_full_name, contributor_limit)
+            print(f"Found {len(contributors)} contributors for {repo_full_name}")
+            
+            # Add repository languages to repo data
+            repo["languages"] = languages_future.result()
             
-            if username in all_contributors:
-                # Already processed: update aggregated info
-                all_contributors[username]["repository_contributions"].append(contribution_info)
-                all_contributors[username]["total_contributions"] += contributor.get("contributions", 0)
-            else:
-                # New contributor, fetch detailed user information
-                user_details = get_user_details(username)
-                if not user_details:
+            # Fetch details for all contributors not seen before concurrently; the results
+            # are merged below in contributor order, so all_contributors stays single-threaded
+            new_usernames = list(dict.fromkeys(
+                username for username in (contributor.get("login") for contributor in contributors)
+                if username and username not in all_contributors
+            ))
+            new_user_details = dict(zip(new_usernames, executor.map(get_user_details, new_usernames)))
+            
+            # Process each contributor
+            for contributor in contributors:
+                username = contributor.get("login")
+                if not username:
                     continue
-                all_contributors[username] = {
-                    "username": username,
-                    "name": user_details.get("name"),
-                    "company": user_details.get("company"),
-                    "blog": user_details.get("blog"),
-                    "location": user_details.get("location"),
-                    "email": user_details.get("email"),
-                    "bio": user_details.get("bio"),
-                    "twitter_username": user_details.get("twitter_username"),
-                    "public_repos": user_details.get("public_repos"),
-                    "public_gists": user_details.get("public_gists"),
-                    "followers": user_details.get("followers"),
-                    "following": user_details.get("following"),
-                    "created_at": user_details.get("created_at"),
-                    "updated_at": user_details.get("updated_at"),
-                    "html_url": user_details.get("html_url"),
-                    "type": user_details.get("type"),
-                    "site_admin": user_details.get("site_admin"),
-                    "total_contributions": contributor.get("contributions", 0),
-                    "repository_contributions": [contribution_info]
+                
+                # Prepare contribution details for the current repository
+                contribution_info = {
+                    "repository": repo_full_name,
+                    "contributions": contributor.get("contributions"),
+                    "repository_stars": repo.get("stargazers_count"),
+                    "repository_language": repo.get("language")
                 }
                 
-        # Save updated repository and contributor data periodically
-        if (i + 1) % 10 == 0 or i == len(repositories) - 1:
-            repo_filename = output_dir / f"repositories_detailed_{timestamp}.csv"
-            save_to_csv(repositories, repo_filename)
+                if username in all_contributors:
+                    # Already processed: update aggregated info
+                    all_contributors[username]["repository_contributions"].append(contribution_info)
+                    all_contributors[username]["total_contributions"] += contributor.get("contributions", 0)
+                else:
+                    # New contributor, use the detailed user information fetched above
+                    user_details = new_user_details.get(username)
+                    if not user_details:
+                        continue
+                    all_contributors[username] = {
+                        "username": username,
+                        "name": user_details.get("name"),
+                        "company": user_details.get("company"),
+                        "blog": user_details.get("blog"),
+                        "location": user_details.get("location"),
+                        "email": user_details.get("email"),
+                        "bio": user_details.get("bio"),
+                        "twitter_username": user_details.get("twitter_username"),
+                        "public_repos": user_details.get("public_repos"),
+                        "public_gists": user_details.get("public_gists"),
+                        "followers": user_details.get("followers"),
+                        "following": user_details.get("following"),
+                        "created_at": user_details.get("created_at"),
+                        "updated_at": user_details.get("updated_at"),
+                        "html_url": user_details.get("html_url"),
+                        "type": user_details.get("type"),
+                        "site_admin": user_details.get("site_admin"),
+                        "total_contributions": contributor.get("contributions", 0),
+                        "repository_contributions": [contribution_info]
+                    }
+                    
+            # Append the processed repository, flushing every 10 so the files stay current
+            detailed_writer.writerow(_to_csv_row(repo, detailed_fieldnames))
+            contributors_saved = False
+            if repo_count % 10 == 0:
+                repo_file.flush()
+                detailed_file.flush()
             
-            # Convert the contributors dict to a list for CSV export
-            all_contributors_list = list(all_contributors.values())
-            if all_contributors_list:
-                contributor_filename = output_dir / f"contributors_{timestamp}.csv"
-                save_to_csv(all_contributors_list, contributor_filename)
-                
-        time.sleep(1)  # Be kind to the GitHub API
+            # Save contributor data periodically
+            if repo_count == next_contributor_save:
+                contributor_save_interval = min(contributor_save_interval * 2, CONTRIBUTOR_SAVE_MAX_INTERVAL)
+                next_contributor_save += contributor_save_interval
+                save_contributors()
+                contributors_saved = True
+    
+    print(f"Data saved to {repo_filename}")
+    print(f"Data saved to {detailed_filename}")
+    
+    # Save the final contributor data
+    if not contributors_saved:
+        save_contributors()
     
-    print(f"Processed {len(repositories)} repositories and tracked contributions from {len(all_contributors)} contributors")
+    print(f"Processed {repo_count} repositories and tracked contributions from {len(all_contributors)} contributors")
 
 def main():
     """Main entry point for the script."""
@@ -4,6 +4,11 @@ import json
 import time
 import requests
 import pickle
+import shelve
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 from dotenv import load_dotenv
 from tqdm import tqdm
@@ -20,6 +25,32 @@ headers = {
     "Accept": "application/vnd.github.v3+json"
 }
 
+SEARCH_REPOSITORIES_URL = "https://api.github.com/search/repositories"
+
+# CSV columns; the repository ones are also the keys read from the API's repository objects
+REPOSITORY_COLUMNS = ("id", "name", "full_name", "html_url", "description", "stargazers_count", "language")
+REPOSITORY_DETAIL_COLUMNS = (
+    "id", "name", "full_name", "html_url", "description",
+    "stargazers_count", "forks_count", "open_issues_count",
+    "language", "topics", "created_at", "updated_at", "size"
+)
+CONTRIBUTOR_COLUMNS = (
+    "id", "username", "name", "html_url", "contributions",
+    "followers", "public_repos", "location", "company", "repository"
+)
+
+# Timeout (seconds) for GitHub API requests
+REQUEST_TIMEOUT = 30
+
+# Number of contributors' user details fetched at the same time
+USER_FETCH_WORKERS = 8
+
+# Below this many remaining calls, spread the rest evenly over the rate limit window
+RATE_LIMIT_LOW_WATER = 100
+
+# Write buffer for the CSV files, which stay open for the whole run
+CSV_BUFFER_SIZE = 1 << 20
+
 # Directory to store data
 DATA_DIR = "github_data"
 CHECKPOINT_DIR = "checkpoints"
@@ -28,11 +59,48 @@ CHECKPOINT_DIR = "checkpoints"
 os.makedirs(DATA_DIR, exist_ok=True)
 os.makedirs(CHECKPOINT_DIR, exist_ok=True)
 
-# Checkpoint file path
-CHECKPOINT_FILE = os.path.join(CHECKPOINT_DIR, "scraper_checkpoint.pkl")
+# Checkpoint files: a small state file plus append-only logs of processed repositories
+# and contributors, so saving a checkpoint only writes what changed since the last one
+CHECKPOINT_STATE_FILE = os.path.join(CHECKPOINT_DIR, "state.json")
+PROCESSED_REPOS_LOG = os.path.join(CHECKPOINT_DIR, "processed_repos.log")
+PROCESSED_CONTRIBUTORS_LOG = os.path.join(CHECKPOINT_DIR, "processed_contributors.log")
+
+# Details of contributors already looked up (null for users that no longer exist), one JSON
+# object per line, so contributors to several repositories are only fetched once
+USER_CACHE_FILE = os.path.join(CHECKPOINT_DIR, "user_cache.jsonl")
+USER_FIELDS = ("name", "followers", "public_repos", "location", "company")
+
+# Repository id -> (ETag, repository JSON) from earlier runs, so unchanged repositories can be
+# refreshed with conditional requests, which don't count against the rate limit
+ETAG_CACHE_FILE = os.path.join(CHECKPOINT_DIR, "etag_cache")
+
+# Pickled checkpoint written by older versions, migrated to the logs on load
+LEGACY_CHECKPOINT_FILE = os.path.join(CHECKPOINT_DIR, "scraper_checkpoint.pkl")
 
 class GitHubScraper:
     def __init__(self):
+        # Pooled session so API calls reuse keep-alive connections; transient gateway errors
+        # are retried by the adapter (rate limits are handled by get() and the methods below)
+        self.session = requests.Session()
+        self.session.headers.update(headers)
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=5, backoff_factor=1, status_forcelist=[502, 503, 504],
+                              respect_retry_after_header=True)
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
+        # Latest (remaining, reset time) reported by GitHub for each rate limit resource
+        self.rate_limits = {}
+        self.rate_limit_lock = threading.Lock()
+        
+        # Workers for fetching contributors' user details concurrently
+        self.executor = ThreadPoolExecutor(max_workers=USER_FETCH_WORKERS)
+        
+        self.etag_cache = shelve.open(ETAG_CACHE_FILE)
+        
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.repositories_file = os.path.join(DATA_DIR, f"repositories_{self.timestamp}.csv")
         self.repositories_detailed_file = os.path.join(DATA_DIR, f"repositories_detailed_{self.timestamp}.csv")
@@ -40,61 +108,273 @@ class GitHubScraper:
         
         # Checkpoint state
         self.checkpoint = {
-            "last_processed_repo_index": 0,
             "processed_repos": set(),
             "processed_contributors": set(),
             "timestamp": self.timestamp
         }
         
+        # Processed markers not yet appended to the checkpoint logs
+        self.repos_log_buffer = []
+        self.contributors_log_buffer = []
+        
+        # User details by contributor id, and the entries not yet appended to USER_CACHE_FILE
+        self.user_cache = {}
+        self.user_cache_buffer = []
+        
         # Load checkpoint if exists
         self.load_checkpoint()
         
+        # Open the CSV files once for the whole run instead of reopening them for every row
+        self.repositories_fh, self.repositories_writer = self.open_csv(
+            self.repositories_file, REPOSITORY_COLUMNS
+        )
+        self.repositories_detailed_fh, self.repositories_detailed_writer = self.open_csv(
+            self.repositories_detailed_file, REPOSITORY_DETAIL_COLUMNS
+        )
+        self.contributors_fh, self.contributors_writer = self.open_csv(
+            self.contributors_file, CONTRIBUTOR_COLUMNS
+        )
+        
+    def open_csv(self, path, header):
+        """Open a CSV file for appending, writing its header if the file is new"""
+        is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+        f = open(path, 'a', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE)
+        writer = csv.writer(f)
+        if is_new:
+            writer.writerow(header)
+        return f, writer
+    
+    def flush_csv_files(self):
+        """Write buffered CSV rows to disk"""
+        for f in (self.repositories_fh, self.repositories_detailed_fh, self.contributors_fh):
+            f.flush()
+    
+    def close(self):
+        """Flush and close the CSV files and the ETag cache, and stop the worker threads"""
+        for f in (self.repositories_fh, self.repositories_detailed_fh, self.contributors_fh):
+            f.close()
+        self.etag_cache.close()
+        self.executor.shutdown()
+    
     def load_checkpoint(self):
         """Load checkpoint if it exists"""
-        if os.path.exists(CHECKPOINT_FILE):
+        if os.path.exists(CHECKPOINT_STATE_FILE):
             try:
-                with open(CHECKPOINT_FILE, 'rb') as f:
+                with open(CHECKPOINT_STATE_FILE, 'r', encoding='utf-8') as f:
+                    saved_checkpoint = json.load(f)
+                
+                saved_checkpoint["processed_repos"] = {int(line) for line in self.read_log(PROCESSED_REPOS_LOG)}
+                saved_checkpoint["processed_contributors"] = {
+                    tuple(map(int, line.split())) for line in self.read_log(PROCESSED_CONTRIBUTORS_LOG)
+                }
+                
+                self.apply_checkpoint(saved_checkpoint)
+                self.load_user_cache()
+            except Exception as e:
+                print(f"Error loading checkpoint: {e}")
+        elif os.path.exists(LEGACY_CHECKPOINT_FILE):
+            # The migrated entries are written to the logs from scratch
+            self.reset_logs()
+            try:
+                with open(LEGACY_CHECKPOINT_FILE, 'rb') as f:
                     saved_checkpoint = pickle.load(f)
                 
-                # Update file paths with saved timestamp
-                if "timestamp" in saved_checkpoint:
-                    self.timestamp = saved_checkpoint["timestamp"]
-                    self.repositories_file = os.path.join(DATA_DIR, f"repositories_{self.timestamp}.csv")
-                    self.repositories_detailed_file = os.path.join(DATA_DIR, f"repositories_detailed_{self.timestamp}.csv")
-                    self.contributors_file = os.path.join(DATA_DIR, f"contributors_{self.timestamp}.csv")
+                # Old contributor keys were "<id>_<full_name>" strings without the repository id,
+                # so they can't be carried over; only the repository in progress is affected
+                saved_checkpoint["processed_contributors"] = set()
+                self.apply_checkpoint(saved_checkpoint)
                 
-                self.checkpoint = saved_checkpoint
-                print(f"Resuming from checkpoint: {self.checkpoint['last_processed_repo_index']} repositories processed")
+                # Everything in the old checkpoint goes into the logs on the next save
+                self.repos_log_buffer.extend(self.checkpoint["processed_repos"])
+                print(f"Migrating checkpoint from {LEGACY_CHECKPOINT_FILE}")
             except Exception as e:
                 print(f"Error loading checkpoint: {e}")
+        else:
+            # Fresh start: logs left by a run that never saved its state must not be read back
+            # on the next resume
+            self.reset_logs()
+    
+    def apply_checkpoint(self, saved_checkpoint):
+        """Use a loaded checkpoint as the current state"""
+        # Update file paths with saved timestamp
+        if "timestamp" in saved_checkpoint:
+            self.timestamp = saved_checkpoint["timestamp"]
+            self.repositories_file = os.path.join(DATA_DIR, f"repositories_{self.timestamp}.csv")
+            self.repositories_detailed_file = os.path.join(DATA_DIR, f"repositories_detailed_{self.timestamp}.csv")
+            self.contributors_file = os.path.join(DATA_DIR, f"contributors_{self.timestamp}.csv")
+        
+        self.checkpoint = saved_checkpoint
+        print(f"Resuming from checkpoint: {len(self.checkpoint['processed_repos'])} repositories processed")
+    
+    def load_user_cache(self):
+        """Load the user details cached by the run being resumed"""
+        for line in self.read_log(USER_CACHE_FILE):
+            entry = json.loads(line)
+            self.user_cache[entry["id"]] = entry["user"]
+        print(f"Loaded {len(self.user_cache)} cached users")
+    
+    def cache_user(self, contributor_id, user_data):
+        """Remember a user's details, or None for a user that doesn't exist"""
+        if user_data is not None:
+            user_data = {field: user_data[field] for field in USER_FIELDS if field in user_data}
+        self.user_cache[contributor_id] = user_data
+        self.user_cache_buffer.append(json.dumps({"id": contributor_id, "user": user_data}))
+    
+    def mark_repo_processed(self, repo_id):
+        """Record a repository as processed"""
+        self.checkpoint["processed_repos"].add(repo_id)
+        self.repos_log_buffer.append(repo_id)
+    
+    def mark_contributors_processed(self, contrib_keys):
+        """Record contributors of a repository as processed, keyed by (contributor id, repo id)"""
+        self.checkpoint["processed_contributors"].update(contrib_keys)
+        self.contributors_log_buffer.extend(contrib_keys)
+    
+    def read_log(self, path):
+        """Read the complete lines of a checkpoint log"""
+        if not os.path.exists(path):
+            return []
+        with open(path, 'rb+') as f:
+            data = f.read()
+            end = data.rfind(b'\n') + 1
+            if end < len(data):
+                # The last line was cut off by a crash while appending; drop it so the next
+                # append starts on a fresh line
+                f.truncate(end)
+        return [line for line in data[:end].decode('utf-8').splitlines() if line.strip()]
+    
+    def reset_logs(self):
+        """Remove the checkpoint logs and the user cache of an earlier run"""
+        for path in (PROCESSED_REPOS_LOG, PROCESSED_CONTRIBUTORS_LOG, USER_CACHE_FILE):
+            if os.path.exists(path):
+                os.remove(path)
+    
+    def append_to_log(self, path, entries):
+        """Append entries to a checkpoint log, one per line"""
+        if not entries:
+            return
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write('\n'.join(map(str, entries)) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
     
     def save_checkpoint(self):
         """Save current state to checkpoint file"""
-        with open(CHECKPOINT_FILE, 'wb') as f:
-            pickle.dump(self.checkpoint, f)
-        print(f"Checkpoint saved: {self.checkpoint['last_processed_repo_index']} repositories processed")
+        # Flush the CSV rows first, so the checkpoint never covers rows that aren't on disk
+        self.flush_csv_files()
+        
+        self.append_to_log(PROCESSED_REPOS_LOG, self.repos_log_buffer)
+        self.repos_log_buffer = []
+        self.append_to_log(
+            PROCESSED_CONTRIBUTORS_LOG,
+            [f"{contributor_id} {repo_id}" for contributor_id, repo_id in self.contributors_log_buffer]
+        )
+        self.contributors_log_buffer = []
+        self.append_to_log(USER_CACHE_FILE, self.user_cache_buffer)
+        self.user_cache_buffer = []
+        
+        # Write the state to a temporary file and swap it in, so a crash leaves either the old
+        # or the new state file, never a truncated one
+        tmp_file = CHECKPOINT_STATE_FILE + ".tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({"timestamp": self.checkpoint["timestamp"]}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, CHECKPOINT_STATE_FILE)
+        print(f"Checkpoint saved: {len(self.checkpoint['processed_repos'])} repositories processed")
+    
+    def get(self, url, params=None, headers=None, resource="core"):
+        """GET a GitHub API URL, pacing requests by the rate limit budget GitHub reports"""
+        self.throttle(resource)
+        response = self.session.get(url, params=params, headers=headers, timeout=REQUEST_TIMEOUT)
+        
+        if 'X-RateLimit-Remaining' in response.headers and 'X-RateLimit-Reset' in response.headers:
+            resource = response.headers.get('X-RateLimit-Resource', resource)
+            self.rate_limits[resource] = (
+                int(response.headers['X-RateLimit-Remaining']),
+                int(response.headers['X-RateLimit-Reset'])
+            )
+        return response
+    
+    def throttle(self, resource):
+        """Sleep just long enough to spread the remaining calls over the reset window"""
+        if resource not in self.rate_limits:
+            return
+        
+        remaining, reset_time = self.rate_limits[resource]
+        if remaining >= RATE_LIMIT_LOW_WATER:
+            return
+        
+        # Concurrent user fetches take turns, so the pacing delays add up instead of overlapping
+        with self.rate_limit_lock:
+            sleep_time = (reset_time - time.time()) / max(remaining, 1)
+            if sleep_time > 0:
+                time.sleep(sleep_time)
+    
+    def fetch_users(self, contributors):
+        """Fetch the details of contributors concurrently, retrying those that hit the rate limit"""
+        user_responses = {}
+        while contributors:
+            responses = self.executor.map(self.fetch_user, [contributor['url'] for contributor in contributors])
+            
+            rate_limited = []
+            for contributor, response in zip(contributors, responses):
+                if not isinstance(response, Exception) and self.is_rate_limited(response):
+                    rate_limited.append(contributor)
+                    rate_limited_response = response
+                else:
+                    user_responses[contributor['id']] = response
+            
+            # Wait once for the whole batch, then fetch the rate limited users again
+            if rate_limited:
+                sleep_time = self.rate_limit_delay(rate_limited_response)
+                print(f"Rate limit exceeded. Sleeping for {sleep_time:.2f} seconds.")
+                time.sleep(sleep_time)
+            contributors = rate_limited
+        return user_responses
+    
+    def fetch_user(self, user_url):
+        """Fetch a user's details, returning the response or the exception raised (runs in the executor)"""
+        try:
+            return self.get(user_url)
+        except Exception as e:
+            return e
+    
+    def is_rate_limited(self, response):
+        """Check whether a response was rejected by a primary or secondary rate limit"""
+        return response.status_code in (403, 429) and 'rate limit' in response.text.lower()
+    
+    def rate_limit_delay(self, response):
+        """Seconds to wait after a rate limited response"""
+        # Secondary rate limits say exactly how long to wait
+        retry_after = response.headers.get('Retry-After')
+        if retry_after and retry_after.isdigit():
+            return int(retry_after)
+        
+        reset_time = int(response.headers.get('X-RateLimit-Reset', 0))
+        return max(reset_time - time.time(), 0) + 10
     
     def search_repositories(self, keywords, min_stars=100, limit=5000):
         """Search for repositories matching keywords with at least min_stars stars"""
         all_repos = []
-        
-        # Create repositories CSV file if it doesn't exist
-        if not os.path.exists(self.repositories_file):
-            with open(self.repositories_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(["id", "name", "full_name", "html_url", "description", "stargazers_count", "language"])
+        # The keywords overlap, so the same repositories come up under several of them
+        seen_ids = set()
         
         for keyword in keywords:
             page = 1
             while len(all_repos) < limit:
                 try:
-                    query = f"{keyword} stars:>={min_stars}"
-                    url = f"https://api.github.com/search/repositories?q={query}&sort=stars&order=desc&page={page}&per_page=100"
-                    response = requests.get(url, headers=headers)
+                    params = {
+                        "q": f"{keyword} stars:>={min_stars}",
+                        "sort": "stars",
+                        "order": "desc",
+                        "page": page,
+                        "per_page": 100
+                    }
+                    response = self.get(SEARCH_REPOSITORIES_URL, params=params, resource="search")
                     
-                    if response.status_code == 403 and 'rate limit exceeded' in response.text.lower():
-                        reset_time = int(response.headers.get('X-RateLimit-Reset', 0))
-                        sleep_time = max(reset_time - time.time(), 0) + 10
+                    if self.is_rate_limited(response):
+                        sleep_time = self.rate_limit_delay(response)
                         print(f"Rate limit exceeded. Sleeping for {sleep_time:.2f} seconds.")
                         time.sleep(sleep_time)
                         continue
@@ -105,21 +385,18 @@ class GitHubScraper:
                     if not data.get('items'):
                         break
                     
-                    # Append to CSV file
-                    with open(self.repositories_file, 'a', newline='', encoding='utf-8') as f:
-                        writer = csv.writer(f)
-                        for repo in data['items']:
-                            if repo['id'] not in self.checkpoint["processed_repos"]:
-                                writer.writerow([
-                                    repo['id'],
-                                    repo['name'],
-                                    repo['full_name'],
-                                    repo['html_url'],
-                                    repo.get('description', ''),
-                                    repo['stargazers_count'],
-                                    repo.get('language', '')
-                                ])
-                                all_repos.append(repo)
+                    # Append the whole page to the CSV file in one call
+                    new_repos = []
+                    for repo in data['items']:
+                        if repo['id'] not in seen_ids and repo['id'] not in self.checkpoint["processed_repos"]:
+                            seen_ids.add(repo['id'])
+                            new_repos.append(repo)
+                    new_repos = new_repos[:limit - len(all_repos)]
+                    self.repositories_writer.writerows([
+                        [repo.get(column, '') for column in REPOSITORY_COLUMNS]
+                        for repo in new_repos
+                    ])
+                    all_repos.extend(new_repos)
                     
                     page += 1
                     
@@ -131,115 +408,93 @@ class GitHubScraper:
                     print(f"Error searching repositories: {e}")
                     time.sleep(10)  # Wait before retrying
         
+        # Most starred first, across all keywords
+        all_repos.sort(key=lambda repo: repo['stargazers_count'], reverse=True)
         return all_repos
     
-    def get_repository_details(self, repositories):
-        """Get detailed information for each repository"""
-        # Create detailed repositories CSV file if it doesn't exist
-        if not os.path.exists(self.repositories_detailed_file):
-            with open(self.repositories_detailed_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    "id", "name", "full_name", "html_url", "description", 
-                    "stargazers_count", "forks_count", "open_issues_count", 
-                    "language", "topics", "created_at", "updated_at", "size"
-                ])
+    def get_repository_details(self, repositories, min_contrib_stars=0, max_size_kb=None):
+        """Get detailed information for each repository, and contributors for those meeting the star/size policy"""
+        # By default (min_contrib_stars=0, no max_size_kb) contributors are fetched for every repository
         
-        # Start from the last processed repository
-        start_idx = self.checkpoint["last_processed_repo_index"]
+        # search_repositories already leaves out repositories processed before an interruption,
+        # so the progress bar counts (and estimates) only the remaining work
+        progress = tqdm(repositories, mininterval=0.5)
         
-        for i, repo in enumerate(tqdm(repositories[start_idx:], initial=start_idx, total=len(repositories))):
+        for n, repo in enumerate(progress, 1):
             try:
-                # Update the current index
-                current_idx = start_idx + i
-                self.checkpoint["last_processed_repo_index"] = current_idx
-                
-                # Skip if already processed
-                if repo['id'] in self.checkpoint["processed_repos"]:
-                    continue
-                
                 url = f"https://api.github.com/repos/{repo['full_name']}"
-                response = requests.get(url, headers=headers)
                 
-                if response.status_code == 403 and 'rate limit exceeded' in response.text.lower():
-                    reset_time = int(response.headers.get('X-RateLimit-Reset', 0))
-                    sleep_time = max(reset_time - time.time(), 0) + 10
+                # Ask for the repository only if it changed since an earlier run fetched it
+                cache_key = str(repo['id'])
+                cached = self.etag_cache.get(cache_key)
+                request_headers = {"If-None-Match": cached[0]} if cached else None
+                
+                # Retry this repository until the request gets past the rate limit
+                while True:
+                    response = self.get(url, headers=request_headers)
+                    if not self.is_rate_limited(response):
+                        break
+                    
+                    sleep_time = self.rate_limit_delay(response)
                     print(f"Rate limit exceeded. Sleeping for {sleep_time:.2f} seconds.")
                     
                     # Save checkpoint before sleeping
                     self.save_checkpoint()
                     
                     time.sleep(sleep_time)
-                    # Retry this repository
-                    i -= 1
-                    continue
                 
-                response.raise_for_status()
-                repo_data = response.json()
+                if response.status_code == 304:
+                    repo_data = cached[1]
+                else:
+                    response.raise_for_status()
+                    repo_data = response.json()
+                    
+                    etag = response.headers.get('ETag')
+                    if etag:
+                        self.etag_cache[cache_key] = (etag, repo_data)
                 
                 # Get topics
-                topics = repo_data.get('topics', [])
-                topics_str = ','.join(topics)
+                topics_str = ','.join(repo_data.get('topics', []))
                 
                 # Write to CSV
-                with open(self.repositories_detailed_file, 'a', newline='', encoding='utf-8') as f:
-                    writer = csv.writer(f)
-                    writer.writerow([
-                        repo_data['id'],
-                        repo_data['name'],
-                        repo_data['full_name'],
-                        repo_data['html_url'],
-                        repo_data.get('description', ''),
-                        repo_data['stargazers_count'],
-                        repo_data['forks_count'],
-                        repo_data['open_issues_count'],
-                        repo_data.get('language', ''),
-                        topics_str,
-                        repo_data['created_at'],
-                        repo_data['updated_at'],
-                        repo_data.get('size', 0)
-                    ])
+                self.repositories_detailed_writer.writerow([
+                    topics_str if column == 'topics' else repo_data.get(column, '')
+                    for column in REPOSITORY_DETAIL_COLUMNS
+                ])
                 
-                # Get contributors
-                self.get_contributors(repo_data['full_name'])
+                # Get contributors, the most expensive step, for repositories within the policy
+                if repo_data['stargazers_count'] >= min_contrib_stars and (
+                    max_size_kb is None or repo_data.get('size', 0) <= max_size_kb
+                ):
+                    self.get_contributors(repo_data['full_name'], repo_data['id'])
                 
                 # Mark as processed
-                self.checkpoint["processed_repos"].add(repo['id'])
+                self.mark_repo_processed(repo['id'])
                 
                 # Save checkpoint every 10 repositories
-                if (current_idx + 1) % 10 == 0:
+                if n % 10 == 0:
                     self.save_checkpoint()
                 
-                # Respect rate limit
-                time.sleep(0.5)
-                
             except Exception as e:
                 print(f"Error getting details for {repo['full_name']}: {e}")
                 # Save checkpoint on error
                 self.save_checkpoint()
                 time.sleep(5)  # Wait before continuing
     
-    def get_contributors(self, repo_full_name):
+    def get_contributors(self, repo_full_name, repo_id):
         """Get contributors for a repository"""
-        # Create contributors CSV file if it doesn't exist
-        if not os.path.exists(self.contributors_file):
-            with open(self.contributors_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    "id", "username", "name", "html_url", "contributions", 
-                    "followers", "public_repos", "location", "company", "repository"
-                ])
-        
         try:
             url = f"https://api.github.com/repos/{repo_full_name}/contributors?per_page=100"
-            response = requests.get(url, headers=headers)
             
-            if response.status_code == 403 and 'rate limit exceeded' in response.text.lower():
-                reset_time = int(response.headers.get('X-RateLimit-Reset', 0))
-                sleep_time = max(reset_time - time.time(), 0) + 10
+            # Retry until the request gets past the rate limit
+            while True:
+                response = self.get(url)
+                if not self.is_rate_limited(response):
+                    break
+                
+                sleep_time = self.rate_limit_delay(response)
                 print(f"Rate limit exceeded. Sleeping for {sleep_time:.2f} seconds.")
                 time.sleep(sleep_time)
-                return self.get_contributors(repo_full_name)  # Retry
             
             if response.status_code == 404:
                 print(f"Repository not found: {repo_full_name}")
@@ -250,56 +505,67 @@ class GitHubScraper:
             
             print(f"Found {len(contributors)} contributors for {repo_full_name}")
             
-            for contributor in contributors:
-                # Skip if already processed this contributor for this repo
-                contrib_key = f"{contributor['id']}_{repo_full_name}"
-                if contrib_key in self.checkpoint["processed_contributors"]:
-                    continue
+            # Rows are written in one batch once all contributors have been fetched
+            rows = []
+            new_keys = []
+            
+            # Skip contributors already processed for this repo
+            pending = [
+                contributor for contributor in contributors
+                if (contributor['id'], repo_id) not in self.checkpoint["processed_contributors"]
+            ]
+            
+            # Fetch user details concurrently, except for users already fetched for another repository
+            to_fetch = [contributor for contributor in pending if contributor['id'] not in self.user_cache]
+            user_responses = self.fetch_users(to_fetch)
+            
+            for contributor in pending:
+                contrib_key = (contributor['id'], repo_id)
                 
                 try:
-                    # Get user details
-                    user_url = contributor['url']
-                    user_response = requests.get(user_url, headers=headers)
-                    
-                    if user_response.status_code == 403 and 'rate limit exceeded' in user_response.text.lower():
-                        reset_time = int(user_response.headers.get('X-RateLimit-Reset', 0))
-                        sleep_time = max(reset_time - time.time(), 0) + 10
-                        print(f"Rate limit exceeded. Sleeping for {sleep_time:.2f} seconds.")
-                        time.sleep(sleep_time)
-                        # Skip this contributor for now, will be processed on resume
-                        continue
-                    
-                    if user_response.status_code != 200:
-                        # Skip this contributor if we can't get details
-                        continue
+                    if contributor['id'] in self.user_cache:
+                        user_data = self.user_cache[contributor['id']]
+                    else:
+                        user_response = user_responses[contributor['id']]
+                        if isinstance(user_response, Exception):
+                            raise user_response
                         
-                    user_data = user_response.json()
-                    
-                    # Write to CSV
-                    with open(self.contributors_file, 'a', newline='', encoding='utf-8') as f:
-                        writer = csv.writer(f)
-                        writer.writerow([
-                            contributor['id'],
-                            contributor['login'],
-                            user_data.get('name', ''),
-                            contributor['html_url'],
-                            contributor['contributions'],
-                            user_data.get('followers', 0),
-                            user_data.get('public_repos', 0),
-                            user_data.get('location', ''),
-                            user_data.get('company', ''),
-                            repo_full_name
-                        ])
+                        if user_response.status_code == 404:
+                            # Deleted or suspended user, don't ask again
+                            self.cache_user(contributor['id'], None)
+                            continue
+                        
+                        if user_response.status_code != 200:
+                            # Skip this contributor if we can't get details
+                            continue
+                        
+                        user_data = user_response.json()
+                        self.cache_user(contributor['id'], user_data)
                     
-                    # Mark as processed
-                    self.checkpoint["processed_contributors"].add(contrib_key)
+                    if user_data is None:
+                        continue
                     
-                    # Respect rate limit
-                    time.sleep(0.2)
+                    rows.append((
+                        contributor['id'],
+                        contributor['login'],
+                        user_data.get('name', ''),
+                        contributor['html_url'],
+                        contributor['contributions'],
+                        user_data.get('followers', 0),
+                        user_data.get('public_repos', 0),
+                        user_data.get('location', ''),
+                        user_data.get('company', ''),
+                        repo_full_name
+                    ))
+                    new_keys.append(contrib_key)
                     
                 except Exception as e:
                     print(f"Error getting details for contributor {contributor['login']}: {e}")
             
+            # Write to CSV, then mark the written contributors as processed
+            self.contributors_writer.writerows(rows)
+            self.mark_contributors_processed(new_keys)
+            
         except Exception as e:
             print(f"Error getting contributors for {repo_full_name}: {e}")
 
@@ -313,16 +579,18 @@ def main():
     
     scraper = GitHubScraper()
     
-    # Search for repositories
-    print("Searching for repositories...")
-    repositories = scraper.search_repositories(keywords, min_stars=500, limit=5000)
-    
-    # Get detailed information for each repository
-    print(f"Getting details for {len(repositories)} repositories...")
-    scraper.get_repository_details(repositories)
-    
-    # Save final checkpoint
-    scraper.save_checkpoint()
+    try:
+        # Search for repositories
+        print("Searching for repositories...")
+        repositories = scraper.search_repositories(keywords, min_stars=500, limit=5000)
+        
+        # Get detailed information for each repository
+        print(f"Getting details for {len(repositories)} repositories...")
+        scraper.get_repository_details(repositories)
+    finally:
+        # Save the final checkpoint and close the files even if the run is interrupted
+        scraper.save_checkpoint()
+        scraper.close()
     
     print("Done!")
 